@@ -7,41 +7,141 @@ This package performs basic S3 operations.
 """
 
 import argparse
+import base64
+import collections
+import concurrent.futures
+import errno
 import functools
+import hashlib
+import itertools
+import json
 import logging
+import operator
 import os
-import pprint
+import shutil
 import sys
+import textwrap
 import time
 
-import boto3
-import botocore
-import tabulate
 import tqdm
-import urllib3
+
+# boto3, botocore and tabulate are imported only where they are used.
+# Importing boto3 alone costs hundreds of milliseconds, which would otherwise
+# be paid even by "--help" or argument errors.
+
+# Default number of files transferred in parallel (and of HTTP connections)
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Minimum size of the HTTP connection pool shared by all threads
+MIN_POOL_CONNECTIONS = 64
+
+# Seconds to wait for a TCP connection (botocore default 60). A connection
+# attempt lost on the network is retried instead of stalling a transfer
+CONNECT_TIMEOUT = 5
+
+# Seconds without receiving data before a request is abandoned (botocore
+# default 60). Stalled requests are then retried, and s3transfer retries
+# the part of a download that stalled, not the whole object
+READ_TIMEOUT = 20
+
+# Maximum number of keys S3 returns in a single listing request
+S3_MAX_KEYS = 1000
+
+# Number of listing pages requested ahead, while the current one is processed
+LIST_PREFETCH_PAGES = 2
+
+# Number of DeleteObjects requests (of up to S3_MAX_KEYS keys) sent in parallel
+DELETE_MAX_WORKERS = 4
+
+# One mebibyte
+MIB = 1024 * 1024
+
+# Part size and threshold for multipart transfers. Bigger parts than the
+# boto3 default (8 MiB) mean fewer requests per byte transferred
+MULTIPART_SIZE = 64 * MIB
+
+# Smallest part size accepted by S3
+MIN_PART_SIZE = 5 * MIB
+
+# Objects up to this size are downloaded with a single GetObject request,
+# bypassing the s3transfer machinery (HEAD request, threads and temp file),
+# and uploaded with a single PutObject request
+SMALL_OBJECT_THRESHOLD = 8 * MIB
+
+# ANSI escape codes of the colors used by msg
+COLORS = {
+    "blue": "\033[0;34m",
+    "red": "\033[1;31m",
+    "green": "\033[0;32m",
+    "yellow": "\033[0;33m",
+    "cyan": "\033[0;36m",
+    "resetcolor": "\033[0m",
+}
+# Format strings of colored text, built once at import
+COLOR_TEMPLATES = {
+    color: code + "{}" + COLORS["resetcolor"] for color, code in COLORS.items()
+}
+COLOR_TEMPLATES["nocolor"] = "{}"
+# Colors are only written to a terminal, and never if NO_COLOR is set
+# (https://no-color.org). The choice is made once, not by each msg call
+USE_COLORS = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+MSG_TEMPLATES = COLOR_TEMPLATES if USE_COLORS else dict.fromkeys(COLOR_TEMPLATES, "{}")
+
+# Number of files sent at once to an upload worker process
+UPLOAD_CHUNKSIZE = 8
+
+# Number of rows of listobj --table formatted at a time
+TABLE_CHUNK_ROWS = S3_MAX_KEYS
+
+# Number of files reordered at a time to mix the prefixes of parallel uploads
+INTERLEAVE_WINDOW = 128
+
+# Units used to show sizes
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB")
 
 
 ##############################################################################
 # Parses the command line arguments
 ##############################################################################
-def parse_parameters():
-    """Command line parser."""
-    # epilog message: Custom text after the help
-    epilog = """
-    Example of use:
-        %(prog)s listbuckets
-        %(prog)s --profile dev listbuckets
-        %(prog)s -r us-east-1 listbuckets
-        %(prog)s -e https://s3.amazonaws.com listobj my_bucket -t
-        %(prog)s -e https://s3.amazonaws.com upload my_bucket -f file1
-        %(prog)s -e https://s3.amazonaws.com upload my_bucket -d mydir
+def print_version():
+    """Print the package version."""
+    from s3_client.__version__ import __version__
+
+    print(__version__)
+
+
+class VersionAction(argparse.Action):
+    """Argparse action to print the package version and exit."""
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print_version()
+        parser.exit()
+
+
+def positive_int(value):
     """
-    # Create the argparse object and define global options
-    parser = argparse.ArgumentParser(
-        description="S3 Client sample script",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=epilog,
-    )
+    Argparse type of options that must be a positive integer.
+
+    Params:
+        value        (str): option value
+
+    Return:
+        (int) the value converted to int
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return number
+
+
+def add_global_arguments(parser):
+    """Add the options shared by all commands to parser."""
     parser.add_argument(
         "-d", "--debug", action="store_true", dest="debug", help="debug flag"
     )
@@ -54,19 +154,63 @@ def parse_parameters():
     parser.add_argument(
         "--profile", default=None, dest="aws_profile", help="AWS profile to use"
     )
-    # Add subcommands options
-    subparsers = parser.add_subparsers(title="Commands", dest="command")
+    parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        dest="max_concurrency",
+        help="Maximum number of files transferred in parallel. Default %(default)s",
+    )
+    parser.add_argument(
+        "--part-size",
+        type=int,
+        default=MULTIPART_SIZE // MIB,
+        dest="part_size",
+        metavar="MIB",
+        help="Part size, in MiB, of multipart transfers. Files larger than it "
+        "are transferred in parts. Default %(default)s",
+    )
+    parser.add_argument(
+        "--part-concurrency",
+        type=positive_int,
+        default=None,
+        dest="part_concurrency",
+        metavar="N",
+        help="Number of parts transferred in parallel, shared by all files. "
+        "Default the largest of 10, 2 x CPUs and --max-concurrency",
+    )
+    parser.add_argument(
+        "--cacert",
+        default=None,
+        dest="ca_bundle",
+        help="CA bundle used to verify the endpoint TLS certificate",
+    )
+    parser.add_argument(
+        "--accelerate",
+        action="store_true",
+        dest="accelerate",
+        help="Use the S3 Transfer Acceleration endpoint (must be enabled on "
+        "the bucket). Faster for long distance transfers",
+    )
+    parser.add_argument(
+        "--dualstack",
+        action="store_true",
+        dest="dualstack",
+        help="Use the S3 dual-stack (IPv4 and IPv6) endpoint",
+    )
 
-    # List buckets
-    listbuckets_parser = subparsers.add_parser("listbuckets", help="List all buckets")
-    listbuckets_parser.add_argument(
+
+def build_listbuckets_parser(parser):
+    """Add listbuckets command arguments."""
+    parser.add_argument(
         "--acl", default=False, action="store_true", help="Show ACL information"
     )
-    listbuckets_parser.set_defaults(func=cmd_list_buckets)
+    parser.set_defaults(func=cmd_list_buckets)
 
-    # List objects
-    list_parser = subparsers.add_parser("listobj", help="List objects in a bucket")
-    list_parser.add_argument(
+
+def build_listobj_parser(parser):
+    """Add listobj command arguments."""
+    parser.add_argument(
         "-l",
         "--limit",
         type=int,
@@ -74,25 +218,24 @@ def parse_parameters():
         default=None,
         help="Limit the number of objects returned",
     )
-    list_parser.add_argument(
+    parser.add_argument(
         "-t", "--table", action="store_true", help="Show output as table"
     )
-    list_parser.add_argument(
+    parser.add_argument(
         "-p", "--prefix", required=False, help="Only objects with specific prefix"
     )
-    list_parser.add_argument(
+    parser.add_argument(
         "-v", "--versions", action="store_true", help="Show all object versions"
     )
-    list_parser.add_argument("bucket", help="Bucket Name")
-    list_parser.set_defaults(func=cmd_list_obj)
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.set_defaults(func=cmd_list_obj)
 
-    # Delete object
-    deleteobj_parser = subparsers.add_parser(
-        "deleteobj", help="Delete object in a bucket"
-    )
-    deleteobj_parser.add_argument("bucket", help="Bucket Name")
-    deleteobj_parser.add_argument("object", help="Object Key Name")
-    deleteobj_parser.add_argument(
+
+def build_deleteobj_parser(parser):
+    """Add deleteobj command arguments."""
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.add_argument("object", help="Object Key Name")
+    parser.add_argument(
         "-v",
         "--versionid",
         dest="versionid",
@@ -100,71 +243,88 @@ def parse_parameters():
         Object version id (in a versioning bucket this really delete the object version)
         """,
     )
-    deleteobj_parser.set_defaults(func=cmd_delete_obj)
+    parser.set_defaults(func=cmd_delete_obj)
+
 
-    # Metadata objects
-    metadata_parser = subparsers.add_parser("metadataobj", help="List object metadata")
-    metadata_parser.add_argument("bucket", help="Bucket Name")
-    metadata_parser.add_argument("object", help="Object Key Name")
-    metadata_parser.set_defaults(func=cmd_metadata_obj)
+def build_deleteprefix_parser(parser):
+    """Add deleteprefix command arguments."""
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.add_argument("prefix", help="Delete all objects with this prefix")
+    parser.set_defaults(func=cmd_delete_prefix)
 
-    # Upload file
-    upload_parser = subparsers.add_parser("upload", help="Upload files to bucket")
-    upload_parser.add_argument("bucket", help="Bucket Name")
-    upload_parser.add_argument(
+
+def build_metadataobj_parser(parser):
+    """Add metadataobj command arguments."""
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.add_argument("object", help="Object Key Name")
+    parser.set_defaults(func=cmd_metadata_obj)
+
+
+def build_upload_parser(parser):
+    """Add upload command arguments."""
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.add_argument(
         "--nopbar",
         action="store_true",
         help="Disable progress bar",
     )
-    upload_parser.add_argument(
+    parser.add_argument(
         "--nokeepdir",
         default=False,
         action="store_true",
         help="Do not keep local directory structure on uploaded objects names",
     )
-    upload_parser.add_argument(
+    parser.add_argument(
         "-p",
         "--prefix",
         dest="prefix",
         default="",
         help="Prefix to add to the object name on upload",
     )
-    upload_group = upload_parser.add_mutually_exclusive_group(required=True)
+    parser.add_argument(
+        "--processes",
+        type=positive_int,
+        default=0,
+        metavar="N",
+        help="Upload directory files with N processes instead of threads. "
+        "Faster for many small files, as request signing and TLS are not "
+        "serialized by the GIL",
+    )
+    upload_group = parser.add_mutually_exclusive_group(required=True)
     upload_group.add_argument("-f", "--file", dest="filename", help="File to upload")
     upload_group.add_argument(
         "-d", "--dir", dest="dir", help="Directory to upload all files recursively"
     )
-    upload_parser.set_defaults(func=cmd_upload)
+    parser.set_defaults(func=cmd_upload)
 
-    # Download file
-    download_parser = subparsers.add_parser(
-        "download", help="Download files from bucket"
-    )
-    download_parser.add_argument("bucket", help="Bucket Name")
-    download_parser.add_argument(
+
+def build_download_parser(parser):
+    """Add download command arguments."""
+    parser.add_argument("bucket", help="Bucket Name")
+    parser.add_argument(
         "--nopbar",
         action="store_true",
         help="Disable progress bar",
     )
-    download_parser.add_argument(
+    parser.add_argument(
         "-l",
         "--localdir",
         default=".",
         dest="localdir",
         help="Local directory to save downloaded file. Default current directory",
     )
-    download_parser.add_argument(
+    parser.add_argument(
         "-o",
         "--overwrite",
         action="store_true",
         help="Overwrite local destination file if it exists. Default false",
     )
-    download_parser.add_argument(
+    parser.add_argument(
         "-v",
         "--versionid",
         help="Object version id",
     )
-    download_group = download_parser.add_mutually_exclusive_group(required=True)
+    download_group = parser.add_mutually_exclusive_group(required=True)
     download_group.add_argument(
         "-f", "--file", dest="filename", help="Download a specific file"
     )
@@ -174,7 +334,110 @@ def parse_parameters():
         dest="prefix",
         help="Download recursively all files with a prefix.",
     )
-    download_parser.set_defaults(func=cmd_download)
+    parser.set_defaults(func=cmd_download)
+
+
+def build_copy_parser(parser):
+    """Add copy command arguments."""
+    parser.add_argument("src_bucket", help="Source Bucket Name")
+    parser.add_argument("dst_bucket", help="Destination Bucket Name")
+    parser.add_argument(
+        "--dst-prefix",
+        dest="dst_prefix",
+        default="",
+        help="Prefix to add to the destination object names",
+    )
+    copy_group = parser.add_mutually_exclusive_group(required=True)
+    copy_group.add_argument(
+        "-f", "--file", dest="filename", help="Copy a specific object"
+    )
+    copy_group.add_argument(
+        "-p",
+        "--prefix",
+        dest="prefix",
+        help="Copy all objects with a prefix",
+    )
+    parser.set_defaults(func=cmd_copy)
+
+
+# Command name: (help message, function to add the command arguments)
+COMMANDS = {
+    "listbuckets": ("List all buckets", build_listbuckets_parser),
+    "listobj": ("List objects in a bucket", build_listobj_parser),
+    "deleteobj": ("Delete object in a bucket", build_deleteobj_parser),
+    "deleteprefix": (
+        "Delete all objects with a prefix in a bucket",
+        build_deleteprefix_parser,
+    ),
+    "metadataobj": ("List object metadata", build_metadataobj_parser),
+    "upload": ("Upload files to bucket", build_upload_parser),
+    "download": ("Download files from bucket", build_download_parser),
+    "copy": ("Copy objects between buckets, inside S3", build_copy_parser),
+}
+
+
+def sniff_subcommand(argv):
+    """
+    Return the command name given on the command line.
+
+    Global options (and their values) are skipped, so "-e URL listobj"
+    returns "listobj".
+
+    Params:
+        argv     (list): command line arguments, without the program name
+
+    Return:
+        (str) the first positional argument or None if there is none
+    """
+    sniffer = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    add_global_arguments(sniffer)
+    try:
+        _, remaining = sniffer.parse_known_args(argv)
+    except (argparse.ArgumentError, SystemExit):
+        # Let the full parser report the invalid global option
+        return None
+    for arg in remaining:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def parse_parameters():
+    """Command line parser."""
+    # epilog message: Custom text after the help
+    epilog = """
+    Example of use:
+        %(prog)s listbuckets
+        %(prog)s --profile dev listbuckets
+        %(prog)s -r us-east-1 listbuckets
+        %(prog)s -e https://s3.amazonaws.com listobj my_bucket -t
+        %(prog)s -e https://s3.amazonaws.com upload my_bucket -f file1
+        %(prog)s -e https://s3.amazonaws.com upload my_bucket -d mydir
+    """
+    # Create the argparse object and define global options
+    parser = argparse.ArgumentParser(
+        description="S3 Client sample script",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
+    )
+    parser.add_argument(
+        "-V",
+        "--version",
+        action=VersionAction,
+        help="show program's version number and exit",
+    )
+    add_global_arguments(parser)
+    # Add subcommands options
+    subparsers = parser.add_subparsers(title="Commands", dest="command")
+
+    # Only the arguments of the command being executed are added. The other
+    # commands are registered with just their help message, which is enough
+    # for the main help output. If the command is unknown, add all of them.
+    command = sniff_subcommand(sys.argv[1:])
+    for name, (help_msg, build_parser) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_msg)
+        if command not in COMMANDS or command == name:
+            build_parser(command_parser)
 
     # If there is no parameter, print help
     if len(sys.argv) < 2:
@@ -234,6 +497,8 @@ def msg(color, msg_text, exitcode=0, *, end="\n", flush=True, output=None):
     """
     Print colored text.
 
+    Colors are disabled when stdout is not a terminal or NO_COLOR is set.
+
     Arguments:
         color          (str): color name (blue, red, green, yellow,
                               cyan or nocolor)
@@ -254,34 +519,46 @@ def msg(color, msg_text, exitcode=0, *, end="\n", flush=True, output=None):
         msg("blue", "nice text in blue")
         msg("red", "Error in my script. terminating", 1)
     """
-    color_dic = {
-        "blue": "\033[0;34m",
-        "red": "\033[1;31m",
-        "green": "\033[0;32m",
-        "yellow": "\033[0;33m",
-        "cyan": "\033[0;36m",
-        "resetcolor": "\033[0m",
-    }
-
     if not output:
         output = sys.stdout
 
-    if not color or color == "nocolor":
-        print(msg_text, end=end, file=output, flush=flush)
-    else:
-        if color not in color_dic:
-            raise ValueError("Invalid color")
-        print(
-            "{}{}{}".format(color_dic[color], msg_text, color_dic["resetcolor"]),
-            end=end,
-            file=output,
-            flush=flush,
-        )
+    try:
+        template = MSG_TEMPLATES[color or "nocolor"]
+    except KeyError:
+        raise ValueError("Invalid color") from None
+
+    output.write(template.format(msg_text) + end)
+    if flush:
+        output.flush()
 
     if exitcode:
         sys.exit(exitcode)
 
 
+def format_attrs(names, values):
+    """
+    Format attributes as a single line of colored "name: value" pairs.
+
+    Building the whole line at once allows printing it with a single write,
+    instead of two msg calls per attribute.
+
+    Params:
+        names       (iterable): attributes names, shown in cyan
+        values      (iterable): attributes values
+
+    Return:
+        (str) the formatted line
+
+    Example:
+        format_attrs(("key", "size"), ("A", 4)) returns
+        "\033[0;36mkey\033[0m: A \033[0;36msize\033[0m: 4"
+    """
+    name_template = MSG_TEMPLATES["cyan"] + ": {}"
+    return " ".join(
+        name_template.format(name, value) for name, value in zip(names, values)
+    )
+
+
 def create_dir(dir_name):
     """
     Create a local directory. It supports nested directory.
@@ -289,26 +566,112 @@ def create_dir(dir_name):
     Params:
         dir_name   (str): Directory to create
     """
-    # Check if dir_name already exist
-    if os.path.exists(dir_name):
-        if os.path.isfile(dir_name):
-            msg(
-                "red",
-                "Error: path {} exists and is not a directory".format(dir_name),
-                1,
-            )
+    # No existence check beforehand, it would be an extra stat and could
+    # race with concurrent downloads creating the same directory
+    try:
+        os.makedirs(dir_name, exist_ok=True)
+    except FileExistsError:
+        # exist_ok does not cover a path that is not a directory
+        msg("red", "Error: path {} exists and is not a directory".format(dir_name), 1)
+    except PermissionError:
+        msg("red", "Error: PermissionError to create dir {}".format(dir_name), 1)
+
+
+def bytes2human(num, base=1024, precision=1):
+    """
+    Convert a number of bytes to a human readable format.
+
+    Params:
+        num              (int): number of bytes
+        base             (int): 1024 (default) or 1000
+        precision        (int): number of decimal places. default 1
+
+    Return:
+        (tuple) the value formatted as string and its unit
+
+    Example:
+        bytes2human(2048) returns ("2.0", "KB")
+    """
+    integer = int(abs(num))
+    if integer < base:
+        return str(num), "B"
+    # The unit is found from the number of bits or digits, without a loop
+    # of divisions (it is called for each row of a listing)
+    if base == 1024:
+        exponent = (integer.bit_length() - 1) // 10
     else:
-        try:
-            os.makedirs(dir_name)
-        except PermissionError:
-            msg("red", "Error: PermissionError to create dir {}".format(dir_name), 1)
+        exponent = (len(str(integer)) - 1) // 3
+    exponent = min(exponent, len(SIZE_UNITS) - 1)
+    return f"{num / base**exponent:.{precision}f}", SIZE_UNITS[exponent]
+
+
+def check_disk_space(file_name, size):
+    """
+    Check if there is enough free space to store a file.
+
+    Params:
+        file_name        (str): Full path filename
+        size             (int): File size in bytes
+
+    Raise:
+        OSError with errno ENOSPC if free space is not enough
+    """
+    free = shutil.disk_usage(os.path.dirname(file_name) or ".").free
+    if size > free:
+        raise OSError(
+            errno.ENOSPC,
+            "Not enough disk space, {} required and {} available".format(
+                " ".join(bytes2human(size)), " ".join(bytes2human(free))
+            ),
+            file_name,
+        )
+
+
+def print_transfer_summary(count, total_size, elapsed_time, action):
+    """
+    Print the summary of files transferred in parallel.
+
+    Params:
+        count          (int): number of files transferred
+        total_size     (int): number of bytes transferred
+        elapsed_time (float): elapsed time in seconds
+        action         (str): "uploaded" or "downloaded"
+    """
+    rate = int(total_size / elapsed_time) if elapsed_time else 0
+    msg(
+        "green",
+        "{} files, {} {} in {:.2f} seconds ({}/s)".format(
+            count,
+            " ".join(bytes2human(total_size)),
+            action,
+            elapsed_time,
+            " ".join(bytes2human(rate)),
+        ),
+    )
+
+
+def to_json(data):
+    """
+    Format data returned by S3 as indented json.
+
+    Values json does not know how to serialize, like datetime, are
+    converted to string.
+
+    Params:
+        data             (dict|list): data to format
+
+    Return:
+        (str) json formatted data
+    """
+    return json.dumps(data, indent=2, default=str)
 
 
 def time_elapsed(func):
     """
     Calculate elapsed time in seconds.
 
-    Decorator prints function elapsed time after its execution
+    Decorator prints function elapsed time after its execution. Nothing is
+    printed for methods of an instance with a true 'quiet' attribute.
     """
 
     @functools.wraps(func)
@@ -320,8 +683,9 @@ def time_elapsed(func):
         # keep track of total elapsed time for all execution of the function
         wrapped_f.elapsed += elapsed_time
 
-        output = "  - Elapsed time {:.4f} seconds".format(elapsed_time)
-        msg("nocolor", output)
+        if not (args and getattr(args[0], "quiet", False)):
+            output = "  - Elapsed time {:.4f} seconds".format(elapsed_time)
+            msg("nocolor", output)
 
         return result
 
@@ -329,64 +693,170 @@ def time_elapsed(func):
     return wrapped_f
 
 
+def wait_futures(executor, futures):
+    """
+    Wait for all futures to complete.
+
+    If a future raises an exception (including SystemExit raised by msg),
+    the futures not yet started are cancelled and the exception is re-raised.
+
+    Params:
+        executor   (Executor): executor the futures were submitted to
+        futures    (iterable): futures to wait for
+    """
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def run_parallel(func, iterable, max_workers):
+    """
+    Call func for each item of iterable using a pool of threads.
+
+    The iterable is consumed as the work progresses: at most
+    2 * max_workers calls are queued at any time, so a long (or slow)
+    iterable does not need to be read entirely before the first call
+    starts, and memory usage does not grow with its size.
+
+    Params:
+        func         (callable): function to call; each item of iterable is
+                                 a tuple with its positional arguments
+        iterable     (iterable): arguments of each call
+        max_workers       (int): number of threads
+
+    Return:
+        (int) number of calls made
+    """
+    count = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for args in iterable:
+            if len(pending) >= max_workers * 2:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                wait_futures(executor, done)
+            pending.add(executor.submit(func, *args))
+            count += 1
+        wait_futures(executor, pending)
+    return count
+
+
+def prefetch(iterable, depth=LIST_PREFETCH_PAGES):
+    """
+    Iterate over iterable reading up to 'depth' items ahead in a thread.
+
+    Used for listings: the request of the next pages is sent while the
+    current one is processed, instead of after it. Items are returned in
+    order, and an exception raised by the iterable is raised here.
+
+    Params:
+        iterable     (iterable): items to read ahead (e.g. listing pages)
+        depth             (int): number of items read ahead
+    """
+    iterator = iter(iterable)
+    end = object()
+    # A single thread, the iterable is never advanced concurrently
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = collections.deque(
+            executor.submit(next, iterator, end) for _ in range(depth)
+        )
+        while True:
+            item = pending.popleft().result()
+            if item is end:
+                return
+            pending.append(executor.submit(next, iterator, end))
+            yield item
+    finally:
+        # Do not wait for the items read ahead if iteration stops early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class Config:
     """
     Handles configuration for AWS services by initializing a boto3 session.
 
     This class supports initializing configurations using either an AWS profile
-    or environment variables. If an AWS profile is specified, it attempts to use
-    that profile to create a boto3 session. If no profile is specified, it falls back
-    to using credentials specified in environment variables.
+    or the default boto3 credential chain. If an AWS profile is specified, it
+    attempts to use that profile to create a boto3 session. If no profile is
+    specified, credentials are looked up by boto3: environment variables, shared
+    credentials and config files, SSO, container and instance metadata.
 
     Attributes:
         session (boto3.Session): A boto3 Session object initialized.
         region_name (str): The AWS region name.
         s3_endpoint (str): The custom S3 endpoint URL.
+        max_concurrency (int): Maximum number of parallel S3 requests.
+        ca_bundle (str): CA bundle used to verify TLS certificates.
+        part_size (int): Part size, in bytes, of multipart transfers.
+        part_concurrency (int): Number of parts transferred in parallel.
+        accelerate (bool): Use the S3 Transfer Acceleration endpoint.
+        dualstack (bool): Use the S3 dual-stack endpoint.
     """
 
-    def __init__(self, profile_name=None, region_name=None, s3_endpoint=None):
+    def __init__(
+        self,
+        profile_name=None,
+        region_name=None,
+        s3_endpoint=None,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        ca_bundle=None,
+        part_size=MULTIPART_SIZE,
+        part_concurrency=None,
+        accelerate=False,
+        dualstack=False,
+    ):
         """
-        Initialize configurations using AWS profile or environment variables.
+        Initialize configurations using AWS profile or the default credential chain.
         If a profile name is provided, it will use that profile.
-        Otherwise, it checks for environment variables and raises an error if they are not set.
+        It raises ValueError if no credentials are found.
 
         Params:
             profile_name (str, optional): The name of the AWS profile to use.
             region_name (str, optional): The AWS region name to use.
             s3_endpoint (str, optional): The custom S3 endpoint URL.
+            max_concurrency (int, optional): Maximum number of parallel S3 requests.
+            ca_bundle (str, optional): CA bundle used to verify TLS certificates.
+                                       Default the botocore bundle.
+            part_size (int, optional): Part size, in bytes, of multipart transfers.
+            part_concurrency (int, optional): Number of parts transferred in
+                                              parallel. Default the largest of
+                                              10, 2 x CPUs and max_concurrency.
+            accelerate (bool, optional): Use the S3 Transfer Acceleration endpoint.
+            dualstack (bool, optional): Use the S3 dual-stack endpoint.
         """
+        import boto3
+        import botocore.exceptions
+
         self.region_name = region_name
         self.s3_endpoint = s3_endpoint
+        self.max_concurrency = max_concurrency
+        self.ca_bundle = ca_bundle
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(
+                f"Part size must be at least {MIN_PART_SIZE // MIB} MiB (S3 limit)"
+            )
+        self.part_size = part_size
+        self.part_concurrency = part_concurrency or max(
+            10, (os.cpu_count() or 1) * 2, max_concurrency
+        )
+        self.accelerate = accelerate
+        self.dualstack = dualstack
 
+        self.session = boto3.Session(profile_name=profile_name, region_name=region_name)
         if profile_name:
-            self.session = boto3.Session(
-                profile_name=profile_name, region_name=region_name
-            )
-            try:
-                if not self.session.get_credentials():
-                    raise ValueError(
-                        f"Could not find credentials for AWS profile '{profile_name}'"
-                    )
-            except botocore.exceptions.PartialCredentialsError as e:
-                raise ValueError(
-                    f"Partial credentials found for AWS profile '{profile_name}'. {e}"
-                )
+            origin = f" for AWS profile '{profile_name}'"
         else:
-            self.aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-            self.aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-            self.aws_session_token = os.getenv("AWS_SESSION_TOKEN")  # Optional
-
-            if not self.aws_access_key or not self.aws_secret_key:
-                raise ValueError(
-                    "AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY must be set in environment variables."
-                )
-
-            self.session = boto3.Session(
-                region_name=region_name,
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key,
-                aws_session_token=self.aws_session_token,
-            )
+            origin = ""
+        try:
+            if not self.session.get_credentials():
+                raise ValueError(f"Could not find AWS credentials{origin}")
+        except botocore.exceptions.PartialCredentialsError as e:
+            raise ValueError(f"Partial AWS credentials found{origin}. {e}")
 
     def get_session(self):
         """
@@ -398,6 +868,26 @@ class Config:
         return self.session
 
 
+def config_from_args(args):
+    """
+    Return the Config of the global command line options.
+
+    Params:
+        args (argparse.Namespace): Command line arguments
+    """
+    return Config(
+        profile_name=args.aws_profile,
+        region_name=args.region_name,
+        s3_endpoint=args.endpoint,
+        max_concurrency=args.max_concurrency,
+        ca_bundle=args.ca_bundle,
+        part_size=args.part_size * MIB,
+        part_concurrency=args.part_concurrency,
+        accelerate=args.accelerate,
+        dualstack=args.dualstack,
+    )
+
+
 class ProgressBar(tqdm.tqdm):
     """Class to display progress bar."""
 
@@ -416,9 +906,15 @@ class S3:
     Class to handle S3 operations.
 
     Attributes:
-        s3_resource (boto3.resource): The boto3 S3 resource object used to interact with S3.
+        client (botocore.client.S3): The boto3 S3 client used to interact with S3.
+                                     Clients are thread-safe, a single one is
+                                     shared by all threads (and its pool)
         disable_pbar (bool): Flag to disable the progress bar display.
-        buckets_exist (list): A list to cache bucket existence checks.
+        quiet (bool): Flag to disable the per-file messages and progress bar,
+                      used when many files are transferred in parallel.
+        buckets_exist (set): Cache of buckets found to exist.
+        buckets_not_exist (set): Cache of buckets found not to exist.
+        max_concurrency (int): Maximum number of files transferred in parallel.
     """
 
     def __init__(self, config):
@@ -429,12 +925,53 @@ class S3:
             config (Config): The configuration object providing the session,
                              region, and S3 endpoint information.
         """
+        import boto3.s3.transfer
+        import botocore.config
+
+        # The connection pool must be as large as the number of parallel
+        # requests, otherwise the threads wait for (or reopen) connections.
+        # Files run in max_concurrency threads (small ones send a single
+        # request) and the transfer manager threads send multipart parts
+        pool_size = config.max_concurrency + config.part_concurrency
+        client_config = botocore.config.Config(
+            max_pool_connections=max(MIN_POOL_CONNECTIONS, pool_size),
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            tcp_keepalive=True,
+            connect_timeout=CONNECT_TIMEOUT,
+            read_timeout=READ_TIMEOUT,
+            s3={
+                "use_accelerate_endpoint": config.accelerate,
+                "use_dualstack_endpoint": config.dualstack,
+            },
+        )
         boto3_session = config.get_session()
-        self.s3_resource = boto3_session.resource(
-            "s3", endpoint_url=config.s3_endpoint, region_name=config.region_name
+        self.client = boto3_session.client(
+            "s3",
+            endpoint_url=config.s3_endpoint,
+            region_name=config.region_name,
+            config=client_config,
+            verify=config.ca_bundle,
+        )
+        # A single transfer manager (and its thread pool) is shared by all
+        # transfers, also the ones running in parallel threads. Its threads
+        # send the parts of every file, so there are at least as many as
+        # files transferred in parallel
+        self.transfer_config = boto3.s3.transfer.TransferConfig(
+            multipart_threshold=config.part_size,
+            multipart_chunksize=config.part_size,
+            max_concurrency=config.part_concurrency,
+            max_io_queue=1000,
+            io_chunksize=MIB,
         )
+        self.transfer = boto3.s3.transfer.S3Transfer(
+            client=self.client, config=self.transfer_config
+        )
+        self.max_concurrency = config.max_concurrency
         self.disable_pbar = False
-        self.buckets_exist = []
+        self.quiet = False
+        self.small_object_threshold = SMALL_OBJECT_THRESHOLD
+        self.buckets_exist = set()
+        self.buckets_not_exist = set()
 
     def check_bucket_exist(self, bucket_name):
         """
@@ -446,18 +983,24 @@ class S3:
         Return:
             bool: True if the bucket exists, False otherwise.
         """
-        # If bucket was already checked, return it exists
+        import botocore.exceptions
+
+        # If bucket was already checked, return the cached result
         if bucket_name in self.buckets_exist:
             log.debug("bucket %s was already checked, do not check again", bucket_name)
             return True
+        if bucket_name in self.buckets_not_exist:
+            log.debug("bucket %s was already checked, do not check again", bucket_name)
+            return False
 
         try:
             log.debug("Checking if bucket exist: %s", bucket_name)
-            self.s3_resource.meta.client.head_bucket(Bucket=bucket_name)
-            self.buckets_exist.append(bucket_name)
+            self.client.head_bucket(Bucket=bucket_name)
+            self.buckets_exist.add(bucket_name)
             return True
         except botocore.exceptions.ClientError as error:
             if error.response["Error"]["Code"] == "404":
+                self.buckets_not_exist.add(bucket_name)
                 return False
             else:
                 raise
@@ -470,22 +1013,40 @@ class S3:
             bucket_name           (str): Bucket name
 
         Return:
-            (str)
+            (str) "Enabled", "Suspended" or None if never enabled
         """
-        return self.s3_resource.BucketVersioning(bucket_name).status
+        # Called from several threads: use the client, which is thread-safe,
+        # instead of a resource
+        resp = self.client.get_bucket_versioning(Bucket=bucket_name)
+        return resp.get("Status")
 
     def list_buckets(self):
         """
         List all buckets.
 
         Returns:
-            A list of Bucket resources
+            A list of dicts, with 'Name' and 'CreationDate'
+        """
+        return self.client.list_buckets()["Buckets"]
+
+    def bucket_acl(self, bucket_name):
         """
-        return self.s3_resource.buckets.all()
+        Return bucket access control list.
+
+        Params:
+            bucket_name           (str): Bucket name
+
+        Return:
+            (list) grants
+        """
+        return self.client.get_bucket_acl(Bucket=bucket_name)["Grants"]
 
     def list_objects(self, bucket_name, *, prefix=None, limit=None):
         """
-        List objects stored in a bucket.
+        List objects stored in a bucket, page by page.
+
+        No resource is built for each object, the listing is read directly
+        from the ListObjectsV2 responses.
 
         Params:
             bucket_name      (str): Bucket name
@@ -497,22 +1058,24 @@ class S3:
                                     default None
 
         Returns:
-            An iterable of ObjectSummary resources
+            An iterator of dicts, with at least 'Key' and 'Size'
         """
-        if prefix:
-            return (
-                self.s3_resource.Bucket(bucket_name)
-                .objects.filter(
-                    Prefix=prefix,
-                )
-                .limit(limit)
-            )
-        else:
-            return self.s3_resource.Bucket(bucket_name).objects.all().limit(limit)
+        pagination = {"PageSize": min(limit or S3_MAX_KEYS, S3_MAX_KEYS)}
+        if limit:
+            pagination["MaxItems"] = limit
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=bucket_name, Prefix=prefix or "", PaginationConfig=pagination
+        )
+        for page in prefetch(pages):
+            yield from page.get("Contents", [])
 
     def list_objects_versions(self, bucket_name, *, prefix=None, limit=None):
         """
-        List all objects versions stored in a bucket.
+        List all objects versions stored in a bucket, page by page.
+
+        Like list_objects, the listing is read directly from the
+        ListObjectVersions responses.
 
         Params:
             bucket_name      (str): Bucket name
@@ -520,36 +1083,36 @@ class S3:
         Keyword arguments (opt):
             prefix           (str): Filter only objects with specific prefix
                                     default None
-            limit            (int): Limit the number of objects returned
+            limit            (int): Limit the number of versions returned
                                     default None
 
         Returns:
-            An iterable of ObjectVersion resources
+            An iterator of dicts, versions and delete markers. Delete
+            markers have no 'Size', 'StorageClass' and 'ETag'
         """
-        if prefix:
-            return (
-                self.s3_resource.Bucket(bucket_name)
-                .object_versions.filter(
-                    Prefix=prefix,
-                )
-                .limit(limit)
-            )
-        else:
-            return (
-                self.s3_resource.Bucket(bucket_name).object_versions.all().limit(limit)
-            )
+        pagination = {"PageSize": min(limit or S3_MAX_KEYS, S3_MAX_KEYS)}
+        paginator = self.client.get_paginator("list_object_versions")
+        pages = paginator.paginate(
+            Bucket=bucket_name, Prefix=prefix or "", PaginationConfig=pagination
+        )
+        # A page has two lists, MaxItems would not limit their sum
+        versions = itertools.chain.from_iterable(
+            page.get("Versions", []) + page.get("DeleteMarkers", [])
+            for page in prefetch(pages)
+        )
+        return itertools.islice(versions, limit)
 
-    def metadata_object(self, bucket_name, object_name):
+    def metadata_object(self, bucket_name, object_name, version_id=None):
         """
         Return object metadata.
 
         Params:
             bucket_name           (str): Bucket name
             object_name           (str): Object key name
+            version_id            (str): Object version id
         """
-        return self.s3_resource.meta.client.head_object(
-            Bucket=bucket_name, Key=object_name
-        )
+        extraargs = {"VersionId": version_id} if version_id else {}
+        return self.client.head_object(Bucket=bucket_name, Key=object_name, **extraargs)
 
     def delete_object(self, bucket_name, object_name, version_id=None):
         """
@@ -564,12 +1127,26 @@ class S3:
         if version_id:
             obj["VersionId"] = version_id
 
-        return self.s3_resource.Bucket(bucket_name).delete_objects(
-            Delete={"Objects": [obj]}
+        return self.client.delete_objects(Bucket=bucket_name, Delete={"Objects": [obj]})
+
+    def delete_objects(self, bucket_name, object_names):
+        """
+        Delete several objects with a single request.
+
+        Only the objects that could not be deleted are returned in the
+        response ("Errors" key).
+
+        Params:
+            bucket_name           (str): Bucket name
+            object_names         (list): Object key names (up to 1000)
+        """
+        return self.client.delete_objects(
+            Bucket=bucket_name,
+            Delete={"Objects": [{"Key": key} for key in object_names], "Quiet": True},
         )
 
     @time_elapsed
-    def upload_file(self, bucket_name, file_name, key_name=None):
+    def upload_file(self, bucket_name, file_name, key_name=None, *, obj_size=None):
         """
         Upload a file from local source to S3.
 
@@ -579,29 +1156,59 @@ class S3:
             key_name           (str): The name of the key to upload to
                                       If key_name is None, the file_name
                                       is used as object name
+
+        Keyword arguments (opt):
+            obj_size           (int): File size, if already known
         """
         if key_name is None:
             key_name = file_name
 
         log.debug("Uploading file: %s with key: %s", file_name, key_name)
 
-        obj_size = os.path.getsize(file_name)
+        if obj_size is None:
+            obj_size = os.path.getsize(file_name)
         with ProgressBar(
             unit="B",
             unit_scale=True,
             desc="data transferred",
             total=obj_size,
             miniters=1,
-            disable=self.disable_pbar,
+            disable=self.disable_pbar or self.quiet,
         ) as pbar:
-            self.s3_resource.Bucket(bucket_name).upload_file(
-                Filename=file_name,
-                Key=key_name,
-                Callback=pbar.update_to,
-            )
+            if obj_size <= self.small_object_threshold:
+                self.put_object(bucket_name, file_name, key_name)
+                pbar.update_to(obj_size)
+            else:
+                self.transfer.upload_file(
+                    file_name, bucket_name, key_name, callback=pbar.update_to
+                )
+
+    def put_object(self, bucket_name, file_name, key_name):
+        """
+        Upload a file with a single PutObject request.
+
+        The file is read once, to compute its Content-MD5 and as the request
+        body, so S3 can verify the object integrity.
+
+        Params:
+            bucket_name        (str): The name of the bucket to upload to
+            file_name          (str): The path to the file to upload
+            key_name           (str): The name of the key to upload to
+        """
+        with open(file_name, "rb") as file_obj:
+            data = file_obj.read()
+        md5 = hashlib.md5(data, usedforsecurity=False).digest()
+        self.client.put_object(
+            Bucket=bucket_name,
+            Key=key_name,
+            Body=data,
+            ContentMD5=base64.b64encode(md5).decode(),
+        )
 
     @time_elapsed
-    def download_object(self, bucket_name, object_name, dest_name, versionid=None):
+    def download_object(
+        self, bucket_name, object_name, dest_name, versionid=None, *, obj_size=None
+    ):
         """
         Download an object from S3 to local source.
 
@@ -610,34 +1217,93 @@ class S3:
             object_name            (str): Object name
             dest_name              (str): Full path filename to store the object
             versionid             (str): Object version id
+
+        Keyword arguments (opt):
+            obj_size               (int): Object size, if already known (e.g. from
+                                          a listing). Avoids a HEAD request
         """
         log.debug("Downloading object %s to dest %s", object_name, dest_name)
 
-        if versionid:
+        if obj_size is not None:
+            extraargs = {"VersionId": versionid} if versionid else None
+        elif versionid:
             extraargs = {"VersionId": versionid}
-            resp = self.s3_resource.ObjectVersion(
-                bucket_name, object_name, versionid
-            ).head()
-            obj_size = resp["ContentLength"]
-            # Change to 'size' attribute when this boto3 bug got fixed:
-            # https://github.com/boto/boto3/issues/832
-            # self.s3_resource.ObjectVersion(bucket_name, object_name, versionid).size
+            obj_size = self.metadata_object(bucket_name, object_name, versionid)[
+                "ContentLength"
+            ]
         else:
             extraargs = None
-            obj_size = self.s3_resource.ObjectSummary(bucket_name, object_name).size
+            obj_size = self.metadata_object(bucket_name, object_name)["ContentLength"]
 
         log.debug("obj_size: %s, extraargs: %s", obj_size, extraargs)
+        # Fail before any data is transferred if the object does not fit
+        check_disk_space(dest_name, obj_size)
         with ProgressBar(
             unit="B",
             unit_scale=True,
             desc="data transferred",
             total=obj_size,
             miniters=1,
-            disable=self.disable_pbar,
+            disable=self.disable_pbar or self.quiet,
         ) as pbar:
-            self.s3_resource.Bucket(bucket_name).download_file(
-                object_name, dest_name, ExtraArgs=extraargs, Callback=pbar.update_to
-            )
+            if obj_size <= self.small_object_threshold:
+                self.get_object(bucket_name, object_name, dest_name, extraargs)
+                pbar.update_to(obj_size)
+            else:
+                self.transfer.download_file(
+                    bucket_name,
+                    object_name,
+                    dest_name,
+                    extra_args=extraargs,
+                    callback=pbar.update_to,
+                )
+
+    @time_elapsed
+    def copy_object(self, src_bucket, src_key, dst_bucket, dst_key, *, obj_size=None):
+        """
+        Copy an object. The data is copied by S3, it is not transferred.
+
+        Objects smaller than the multipart part size are copied with a
+        single CopyObject request. Larger ones, or of unknown size, by the
+        managed copy, which copies their parts in parallel (UploadPartCopy).
+
+        Params:
+            src_bucket           (str): Source bucket name
+            src_key              (str): Source object name
+            dst_bucket           (str): Destination bucket name
+            dst_key              (str): Destination object name
+
+        Keyword arguments (opt):
+            obj_size             (int): Object size, if already known (e.g. from
+                                        a listing). Avoids a HEAD request
+        """
+        log.debug(
+            "Copying object %s/%s to %s/%s", src_bucket, src_key, dst_bucket, dst_key
+        )
+        client = self.client
+        copy_source = {"Bucket": src_bucket, "Key": src_key}
+        if obj_size is not None and obj_size < self.transfer_config.multipart_threshold:
+            client.copy_object(CopySource=copy_source, Bucket=dst_bucket, Key=dst_key)
+        else:
+            client.copy(copy_source, dst_bucket, dst_key, Config=self.transfer_config)
+
+    def get_object(self, bucket_name, object_name, dest_name, extraargs=None):
+        """
+        Download an object with a single GetObject request.
+
+        Params:
+            bucket_name            (str): Bucket name
+            object_name            (str): Object name
+            dest_name              (str): Full path filename to store the object
+            extraargs             (dict): Extra arguments to GetObject (VersionId)
+        """
+        resp = self.client.get_object(
+            Bucket=bucket_name, Key=object_name, **(extraargs or {})
+        )
+        # Read the whole body first, so a failed transfer leaves no file behind
+        data = resp["Body"].read()
+        with open(dest_name, "wb") as file_obj:
+            file_obj.write(data)
 
 
 class Download:
@@ -655,8 +1321,10 @@ class Download:
         self.s3 = s3
         self.bucket_name = bucket_name
         self.local_dir = local_dir
+        # Directories already created, objects of a prefix share most of them
+        self.created_dirs = set()
 
-    def download_file(self, object_name, overwrite, versionid=None):
+    def download_file(self, object_name, overwrite, versionid=None, *, obj_size=None):
         """
         Download a file from S3.
 
@@ -664,7 +1332,12 @@ class Download:
             object_name          (str): Object name to download
             overwrite     (True/False): Overwrite local file if it already exists
             versionid            (str): Object version id
+
+        Keyword arguments (opt):
+            obj_size             (int): Object size, if already known
         """
+        import botocore.exceptions
+
         # set full file path to store the object
         dest_name = self.define_dest_name(object_name)
 
@@ -673,22 +1346,48 @@ class Download:
             self.check_file_exist(dest_name)
 
         # If necessary, create directories structure to save the downloaded file
-        local_path = "/".join(dest_name.split("/")[:-1])
-        create_dir(local_path)
+        dest_dir = os.path.dirname(dest_name)
+        if dest_dir not in self.created_dirs:
+            create_dir(dest_dir)
+            self.created_dirs.add(dest_dir)
 
-        msg("cyan", "Downloading object {} to path {}".format(object_name, dest_name))
+        if not self.s3.quiet:
+            msg(
+                "cyan",
+                "Downloading object {} to path {}".format(object_name, dest_name),
+            )
 
         try:
-            self.s3.download_object(self.bucket_name, object_name, dest_name, versionid)
+            self.s3.download_object(
+                self.bucket_name, object_name, dest_name, versionid, obj_size=obj_size
+            )
         except PermissionError:
             msg("red", "Error: Permission denied to write file {}".format(dest_name), 1)
-        except botocore.exceptions.ClientError as error:
-            if error.response["Error"]["Code"] == "404":
-                msg("red", "Error:  object '{}' not found.".format(object_name), 1)
+        except OSError as error:
+            if error.errno == errno.ENOSPC:
+                msg(
+                    "red",
+                    "Error: {} to write file {}".format(error.strerror, dest_name),
+                    1,
+                )
             else:
                 raise
+        except botocore.exceptions.ClientError as error:
+            # GetObject (small objects) reports NoSuchKey, HEAD a bare 404
+            code = error.response["Error"]["Code"]
+            if code not in ("404", "NoSuchKey"):
+                raise
+            # HEAD responses have no body, a 404 may also be a missing bucket
+            if code == "404" and not self.s3.check_bucket_exist(self.bucket_name):
+                msg(
+                    "red",
+                    "Error: Bucket '{}' does not exist".format(self.bucket_name),
+                    1,
+                )
+            msg("red", "Error:  object '{}' not found.".format(object_name), 1)
 
-        msg("green", "  - Download completed successfully")
+        if not self.s3.quiet:
+            msg("green", "  - Download completed successfully")
 
     def download_prefix(self, prefix, overwrite):
         """
@@ -698,8 +1397,33 @@ class Download:
             prefix             (str): Object prefix name
             overwrite   (True/False): Overwrite local file if it already exist
         """
-        for obj in self.s3.list_objects(self.bucket_name, prefix=prefix):
-            self.download_file(obj.key, overwrite)
+
+        # Downloads are network bound, run them in parallel. Objects are
+        # submitted while the listing is still being paginated. The listing
+        # already returns the object size, so no HEAD request is needed.
+        # Messages of parallel downloads would be interleaved, only a
+        # summary is shown at the end
+        self.s3.quiet = True
+        total_size = 0
+
+        def download(object_name, obj_size):
+            self.download_file(object_name, overwrite, obj_size=obj_size)
+
+        def downloads():
+            nonlocal total_size
+            for obj in self.s3.list_objects(self.bucket_name, prefix=prefix):
+                total_size += obj["Size"]
+                yield obj["Key"], obj["Size"]
+
+        start_time = time.perf_counter()
+        count = run_parallel(download, downloads(), self.s3.max_concurrency)
+
+        if not count:
+            msg("yellow", "No objects found with prefix '{}'".format(prefix))
+            return
+        print_transfer_summary(
+            count, total_size, time.perf_counter() - start_time, "downloaded"
+        )
 
     def define_dest_name(self, object_name):
         """
@@ -707,16 +1431,8 @@ class Download:
 
         Concatenate local_dir with object_name
         """
-        # Check if its needed to add a '/' between local_dir and object_name
-        if not self.local_dir.endswith("/") and not object_name.startswith("/"):
-            dest_name = self.local_dir + "/" + object_name
-        # Removes duplicated '/' between local_dir and object_name
-        elif self.local_dir.endswith("/") and object_name.startswith("/"):
-            dest_name = self.local_dir + object_name[1:]
-        else:
-            dest_name = self.local_dir + object_name
-
-        return dest_name
+        # Leading '/' would make os.path.join discard local_dir
+        return os.path.join(self.local_dir, object_name.lstrip("/"))
 
     @staticmethod
     def check_file_exist(file_name):
@@ -736,17 +1452,18 @@ class Download:
 ##############################################################################
 def cmd_metadata_obj(s3, args):
     """Handle metadataobj option."""
-    # Check if bucket exist
-    if not s3.check_bucket_exist(args.bucket):
-        msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+    import botocore.exceptions
 
     try:
-        pprint.pprint(s3.metadata_object(args.bucket, args.object))
+        print(to_json(s3.metadata_object(args.bucket, args.object)))
     except botocore.exceptions.ClientError as error:
-        if error.response["Error"]["Code"] == "404":
-            msg("red", "Error: key '{}' not found".format(args.object), 1)
-        else:
+        code = error.response["Error"]["Code"]
+        if code not in ("404", "NoSuchBucket"):
             raise
+        # HEAD responses have no body, a 404 may also be a missing bucket
+        if code == "NoSuchBucket" or not s3.check_bucket_exist(args.bucket):
+            msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+        msg("red", "Error: key '{}' not found".format(args.object), 1)
 
 
 ##############################################################################
@@ -754,81 +1471,207 @@ def cmd_metadata_obj(s3, args):
 ##############################################################################
 def cmd_delete_obj(s3, args):
     """Handle delete object option."""
-    # Check if bucket exist
-    if not s3.check_bucket_exist(args.bucket):
-        msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+    import botocore.exceptions
+
+    # The bucket is not checked beforehand, DeleteObjects already reports it
+    try:
+        resp = s3.delete_object(args.bucket, args.object, args.versionid)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] == "NoSuchBucket":
+            msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+        else:
+            raise
+    print(to_json(resp["Deleted"]))
+
+
+##############################################################################
+# Delete all objects with a prefix
+##############################################################################
+def delete_objects_from_s3(s3, bucket_name, object_names):
+    """
+    Delete a batch of objects and report the result.
+
+    Params:
+        s3 (S3): An instance of the S3 class.
+        bucket_name (str): Bucket name
+        object_names (list): Object key names (up to 1000)
+
+    Return:
+        (int) number of objects not deleted
+    """
+    resp = s3.delete_objects(bucket_name, object_names)
+    errors = resp.get("Errors", [])
+    for error in errors:
+        msg("red", f"Error: object '{error['Key']}' not deleted: {error['Message']}")
+    msg("green", f"  - {len(object_names) - len(errors)} objects deleted")
+    return len(errors)
+
+
+def cmd_delete_prefix(s3, args):
+    """
+    Handle deleteprefix option.
+
+    Objects are deleted in batches of up to 1000 keys (DeleteObjects
+    limit), a few batches at a time, while the prefix is being listed.
+    """
+    import botocore.exceptions
+
+    if not args.prefix:
+        msg("red", "Error: prefix must not be empty", 1)
 
-    resp = s3.delete_object(args.bucket, args.object, args.versionid)
-    pprint.pprint(resp["Deleted"])
+    # The bucket is not checked beforehand, the listing already reports it
+    keys = (obj["Key"] for obj in s3.list_objects(args.bucket, prefix=args.prefix))
+    batches = iter(lambda: list(itertools.islice(keys, S3_MAX_KEYS)), [])
+    deletes = ((s3, args.bucket, batch) for batch in batches)
+    # Number of objects not deleted by each batch
+    errors = []
+
+    def delete(*batch_args):
+        errors.append(delete_objects_from_s3(*batch_args))
+
+    try:
+        count = run_parallel(delete, deletes, DELETE_MAX_WORKERS)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] == "NoSuchBucket":
+            msg("red", f"Error: Bucket '{args.bucket}' does not exist", 1)
+        raise
+    if not count:
+        msg("yellow", f"No objects found with prefix '{args.prefix}'")
+    elif sum(errors):
+        msg("red", f"Error: {sum(errors)} objects not deleted", 1)
 
 
 ##############################################################################
 # Command to list all buckets
 ##############################################################################
+# Attributes shown by listbuckets
+BUCKET_ATTRS = ("name", "creation_date")
+# Keys of the ListBuckets response matching BUCKET_ATTRS
+BUCKET_KEYS = ("Name", "CreationDate")
+
+
 def cmd_list_buckets(s3, args):
     """Handle listbuckets option."""
-    attrs = ["name", "creation_date"]
-    for bucket in s3.list_buckets():
-        for attr in attrs:
-            msg("cyan", attr, end=": ")
-            msg("nocolor", getattr(bucket, attr), end=" ")
-        versioning = s3.check_bucket_versioning(bucket.name)
-        msg("cyan", "versioning_status", end=": ")
-        msg("nocolor", versioning)
-        if args.acl:
-            msg("cyan", "  acl: ")
-            msg("nocolor", "   {}".format(pprint.pformat(bucket.Acl().grants)))
+
+    def bucket_details(bucket):
+        grants = s3.bucket_acl(bucket["Name"]) if args.acl else None
+        return bucket, s3.check_bucket_versioning(bucket["Name"]), grants
+
+    buckets = list(s3.list_buckets())
+    if not buckets:
+        return
+
+    # Versioning and acl require one request per bucket, fetch them in
+    # parallel. executor.map keeps the buckets order
+    workers = min(s3.max_concurrency, len(buckets))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for bucket, versioning, grants in executor.map(bucket_details, buckets):
+            values = [bucket[key] for key in BUCKET_KEYS] + [versioning]
+            msg("nocolor", format_attrs(BUCKET_ATTRS + ("versioning_status",), values))
+            if args.acl:
+                msg("cyan", "  acl: ")
+                msg("nocolor", textwrap.indent(to_json(grants), "   "))
 
 
 ##############################################################################
 # Command to list all bucket's objects
 ##############################################################################
+# Attributes shown by listobj
+OBJECT_ATTRS = ("key", "size", "storage_class", "e_tag", "last_modified")
+OBJECT_VERSION_ATTRS = OBJECT_ATTRS + ("version_id", "is_latest")
+# Keys of the ListObjectsV2 response matching OBJECT_ATTRS
+OBJECT_KEYS = ("Key", "Size", "StorageClass", "ETag", "LastModified")
+# Keys of the ListObjectVersions response matching OBJECT_VERSION_ATTRS
+OBJECT_VERSION_KEYS = OBJECT_KEYS + ("VersionId", "IsLatest")
+
+
 def cmd_list_obj(s3, args):
     """Handle listobj option."""
-    # Check if bucket exist
-    if not s3.check_bucket_exist(args.bucket):
-        msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+    import botocore.exceptions
 
+    # Plain dicts from the paginators, no resource is built per object
     if args.versions:
         objects = s3.list_objects_versions(
             args.bucket, prefix=args.prefix, limit=args.limit
         )
-        # Resource's attributes:
-        attrs = [
-            "key",
-            "size",
-            "storage_class",
-            "e_tag",
-            "last_modified",
-            "version_id",
-            "is_latest",
-        ]
+        attrs = OBJECT_VERSION_ATTRS
+
+        def get_attrs(obj):
+            return tuple(obj.get(key) for key in OBJECT_VERSION_KEYS)
+
     else:
         objects = s3.list_objects(args.bucket, prefix=args.prefix, limit=args.limit)
-        # Resource's attributes:
-        attrs = ["key", "size", "storage_class", "e_tag", "last_modified"]
-
-    if args.table:
-        # Tabulate needs to keep the entire table in-memory
-        table = []
-        # Use the first row of data as a table header
-        table.append(attrs)
-        for obj in objects:
-            line = [getattr(obj, attr) for attr in attrs]
-            table.append(line)
-        print(tabulate.tabulate(table, headers="firstrow", tablefmt="github"))
-    else:
-        for obj in objects:
-            for attr in attrs:
-                msg("cyan", attr, end=": ")
-                msg("nocolor", getattr(obj, attr), end=" ")
-            msg("nocolor", "")
+        attrs = OBJECT_ATTRS
+        get_attrs = operator.itemgetter(*OBJECT_KEYS)
+
+    # The bucket is not checked beforehand, the listing already reports it
+    try:
+        if args.table:
+            print_objects_table(objects, attrs, get_attrs)
+        else:
+            # One write per object, flushed only at the end
+            for obj in objects:
+                msg("nocolor", format_attrs(attrs, get_attrs(obj)), flush=False)
+            sys.stdout.flush()
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] == "NoSuchBucket":
+            msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+        raise
+
+
+def print_objects_table(objects, attrs, get_attrs):
+    """
+    Print objects as a table.
+
+    Tabulate needs all the rows to compute the column widths, so only the
+    first TABLE_CHUNK_ROWS rows are given to it. The next rows are printed
+    as they are listed, with the same column widths (a longer value makes
+    its row wider), so memory does not grow with the number of objects.
+
+    Params:
+        objects      (iterable): objects to print
+        attrs           (tuple): attributes names, used as table header
+        get_attrs    (callable): function returning the attributes of an object
+    """
+    import tabulate
+
+    size_idx = attrs.index("size")
+
+    def table_row(obj):
+        row = list(get_attrs(obj))
+        # Delete markers have no size
+        if row[size_idx] is not None:
+            row[size_idx] = " ".join(bytes2human(row[size_idx]))
+        return row
+
+    rows = map(table_row, objects)
+    table = tabulate.tabulate(
+        itertools.islice(rows, TABLE_CHUNK_ROWS),
+        headers=attrs,
+        tablefmt="github",
+        disable_numparse=True,
+    )
+    print(table)
+
+    # Widths of the columns, from the separator line: |------|------|
+    widths = [len(dashes) - 2 for dashes in table.splitlines()[1].split("|")[1:-1]]
+    for chunk in iter(lambda: list(itertools.islice(rows, TABLE_CHUNK_ROWS)), []):
+        lines = (
+            "| "
+            + " | ".join(
+                ("" if value is None else str(value)).ljust(width)
+                for value, width in zip(row, widths)
+            )
+            + " |"
+            for row in chunk
+        )
+        print("\n".join(lines))
 
 
 ##############################################################################
 # Upload a file to S3
 ##############################################################################
-def upload_file_to_s3(s3, bucket_name, file_path, object_name):
+def upload_file_to_s3(s3, bucket_name, file_path, object_name, file_size=None):
     """
     Upload a single file to an S3 bucket.
 
@@ -838,18 +1681,185 @@ def upload_file_to_s3(s3, bucket_name, file_path, object_name):
         file_path (str): The path of the file on the local file system to upload.
         object_name (str): The target object name in the S3 bucket. This is the name
                            that will be used to store the file in the bucket.
+        file_size (int, optional): The file size, if already known.
     """
+    import boto3.exceptions
+    import botocore.exceptions
 
-    msg("cyan", f"Uploading file {file_path} with object name {object_name}")
+    if not s3.quiet:
+        msg("cyan", f"Uploading file {file_path} with object name {object_name}")
 
     try:
-        s3.upload_file(bucket_name, file_path, object_name)
+        s3.upload_file(bucket_name, file_path, object_name, obj_size=file_size)
     except PermissionError:
         msg("red", f"Error: permission denied to read file {file_path}", 1)
     except FileNotFoundError:
         msg("red", f"Error: File '{file_path}' not found", 1)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] == "NoSuchBucket":
+            msg("red", f"Error: Bucket '{bucket_name}' does not exist", 1)
+        raise
+    except boto3.exceptions.S3UploadFailedError as error:
+        # s3transfer errors only keep the message of the ClientError
+        if "(NoSuchBucket)" in str(error):
+            msg("red", f"Error: Bucket '{bucket_name}' does not exist", 1)
+        raise
+
+    if not s3.quiet:
+        msg("green", "  - Upload completed successfully")
+
+
+def iter_files(root):
+    """
+    Yield the entry (os.DirEntry) of all files under a directory, recursively.
+
+    It uses os.scandir, whose entries carry the file type returned by
+    readdir, so no extra stat call is needed per file, and cache the
+    result of their stat method. Like os.walk,
+    symbolic links to directories are not followed. Directories that
+    cannot be read are reported and skipped.
+
+    Params:
+        root       (str): Directory to walk
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as error:
+            msg(
+                "yellow", f"Warning: skipping directory '{directory}': {error.strerror}"
+            )
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def interleave_by_prefix(object_names, key=None, *, depth=2, window=None):
+    """
+    Reorder items so consecutive ones have different object name prefixes.
+
+    S3 scales request rate per key prefix, so mixing prefixes spreads
+    parallel requests over more partitions. Items are grouped by the first
+    'depth' directory components of their object name (the file name is
+    not part of the prefix) and the groups are taken in round-robin. Only
+    'window' items are read at a time, so the input can be a long generator.
+
+    Params:
+        object_names  (iterable): items to reorder
+        key           (callable): function returning the object name of an
+                                  item. default the item itself
+        depth              (int): number of name components of the prefix
+        window             (int): number of items reordered at a time.
+                                  default INTERLEAVE_WINDOW
+
+    Example:
+        interleave_by_prefix(["a/1", "a/2", "b/1"], depth=1) yields
+        "a/1", "b/1", "a/2"
+    """
+    items = iter(object_names)
+    window = window or INTERLEAVE_WINDOW
+    for chunk in iter(lambda: list(itertools.islice(items, window)), []):
+        groups = {}
+        for item in chunk:
+            name = key(item) if key else item
+            # The file name itself is not part of the prefix
+            prefix = tuple(name.split("/")[:-1][:depth])
+            groups.setdefault(prefix, []).append(item)
+        for items_group in itertools.zip_longest(*groups.values()):
+            yield from (item for item in items_group if item is not None)
+
+
+# S3 instance and failure (exit code and message) of an upload worker process
+worker_s3 = None
+worker_failure = None
+
+
+def init_upload_worker(args):
+    """
+    Initialize an upload worker process.
+
+    Each process has its own S3 instance, i.e., its own session and
+    connection pool.
+
+    An exception raised by an initializer kills the worker and the pool
+    starts a new one, forever. Errors are kept instead, and returned as
+    the result of each upload.
+
+    Params:
+        args (argparse.Namespace): Command line arguments
+    """
+    global log, worker_s3, worker_failure
 
-    msg("green", "  - Upload completed successfully")
+    worker_failure = None
+    try:
+        log = setup_logging() if args.debug else logging
+        worker_s3 = S3(config_from_args(args))
+    except Exception as error:
+        worker_failure = (1, str(error))
+        return
+    worker_s3.quiet = True
+
+
+def upload_file_in_worker(upload):
+    """
+    Upload a file from a worker process.
+
+    Params:
+        upload    (tuple): bucket name, file path, object name and file size
+
+    Return:
+        (tuple) exit code, zero if the upload succeeded, and the error
+                message to print, None if it was already printed
+    """
+    global worker_failure
+
+    # Once the worker failed, the remaining files of its chunk are skipped
+    if worker_failure:
+        return worker_failure
+    try:
+        upload_file_to_s3(worker_s3, *upload)
+    except SystemExit as error:
+        # A worker process must not exit, the pool would wait for its
+        # result forever. The main process exits instead
+        worker_failure = (error.code, None)
+        return worker_failure
+    return 0, None
+
+
+def upload_with_processes(args, uploads):
+    """
+    Upload files using a pool of processes.
+
+    Params:
+        args  (argparse.Namespace): Command line arguments
+        uploads         (iterable): tuples of bucket name, file path,
+                                    object name and file size
+
+    Return:
+        (int) number of files uploaded
+    """
+    import multiprocessing
+
+    count = 0
+    with multiprocessing.Pool(
+        args.processes, initializer=init_upload_worker, initargs=(args,)
+    ) as pool:
+        for exitcode, error in pool.imap_unordered(
+            upload_file_in_worker, uploads, chunksize=UPLOAD_CHUNKSIZE
+        ):
+            if exitcode:
+                if error:
+                    msg("red", error)
+                # Leaving the with block terminates the other workers
+                sys.exit(exitcode)
+            count += 1
+    return count
 
 
 def upload_construct_object_name(file_path, prefix, nokeepdir):
@@ -882,10 +1892,8 @@ def cmd_upload(s3, args):
         s3 (S3): An instance of the S3 class.
         args (argparse.Namespace): Command line arguments.
     """
-    # Check if bucket exist
-    if not s3.check_bucket_exist(args.bucket):
-        msg("red", f"Error: Bucket '{args.bucket}' does not exist", 1)
-
+    # The bucket of a single file is not checked beforehand, the upload
+    # already reports it
     s3.disable_pbar = args.nopbar
 
     if args.filename:
@@ -904,13 +1912,46 @@ def cmd_upload(s3, args):
     if args.dir:
         if not os.path.isdir(args.dir):
             msg("red", f"Error: Directory '{args.dir}' not found", 1)
-        for dirpath, _dirnames, files in os.walk(args.dir):
-            for filename in files:
-                file_path = os.path.join(dirpath, filename)
+        # Otherwise each parallel upload would report the missing bucket
+        if not s3.check_bucket_exist(args.bucket):
+            msg("red", f"Error: Bucket '{args.bucket}' does not exist", 1)
+        # Uploads are network bound, run them in parallel. Files are
+        # uploaded while the directory is still being walked.
+        # Messages of parallel uploads would be interleaved, only a summary
+        # is shown at the end
+        s3.quiet = True
+        total_size = 0
+
+        def uploads():
+            nonlocal total_size
+            for entry in iter_files(args.dir):
+                file_size = entry.stat().st_size
+                total_size += file_size
                 object_name = upload_construct_object_name(
-                    file_path, args.prefix, args.nokeepdir
+                    entry.path, args.prefix, args.nokeepdir
                 )
-                upload_file_to_s3(s3, args.bucket, file_path, object_name)
+                yield s3, args.bucket, entry.path, object_name, file_size
+
+        start_time = time.perf_counter()
+
+        # Object names share the prefix and the directory name, mix them by
+        # the path of the files inside the directory
+        def relative_path(upload):
+            return os.path.relpath(upload[2], args.dir).replace(os.sep, "/")
+
+        uploads_mixed = interleave_by_prefix(uploads(), relative_path)
+        if args.processes:
+            # S3 instance is created by each process
+            uploads_mixed = (upload[1:] for upload in uploads_mixed)
+            count = upload_with_processes(args, uploads_mixed)
+        else:
+            count = run_parallel(upload_file_to_s3, uploads_mixed, s3.max_concurrency)
+        if not count:
+            msg("yellow", f"No files found in directory '{args.dir}'")
+            return
+        print_transfer_summary(
+            count, total_size, time.perf_counter() - start_time, "uploaded"
+        )
 
 
 ##############################################################################
@@ -918,10 +1959,9 @@ def cmd_upload(s3, args):
 ##############################################################################
 def cmd_download(s3, args):
     """Handle download option."""
-    # Check if bucket exist
-    if not s3.check_bucket_exist(args.bucket):
-        msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+    import botocore.exceptions
 
+    # The bucket is not checked beforehand, the download already reports it
     s3.disable_pbar = args.nopbar
 
     # Check if local directory exists
@@ -930,13 +1970,106 @@ def cmd_download(s3, args):
 
     download = Download(s3, args.bucket, args.localdir)
 
-    # Download a specific object
-    if args.filename:
-        download.download_file(args.filename, args.overwrite, args.versionid)
+    try:
+        # Download a specific object
+        if args.filename:
+            download.download_file(args.filename, args.overwrite, args.versionid)
 
-    # Download all objects with a prefix
-    if args.prefix:
-        download.download_prefix(args.prefix, args.overwrite)
+        # Download all objects with a prefix
+        if args.prefix:
+            download.download_prefix(args.prefix, args.overwrite)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] == "NoSuchBucket":
+            msg("red", "Error: Bucket '{}' does not exist".format(args.bucket), 1)
+        raise
+
+
+##############################################################################
+# Command to copy objects
+##############################################################################
+def copy_object_in_s3(s3, src_bucket, src_key, dst_bucket, dst_key, obj_size=None):
+    """
+    Copy a single object between buckets.
+
+    Params:
+        s3               (S3): An instance of the S3 class
+        src_bucket      (str): Source bucket name
+        src_key         (str): Source object name
+        dst_bucket      (str): Destination bucket name
+        dst_key         (str): Destination object name
+        obj_size        (int): Object size, if already known
+    """
+    import botocore.exceptions
+
+    if not s3.quiet:
+        msg(
+            "cyan",
+            f"Copying object s3://{src_bucket}/{src_key} to s3://{dst_bucket}/{dst_key}",
+        )
+
+    try:
+        s3.copy_object(src_bucket, src_key, dst_bucket, dst_key, obj_size=obj_size)
+    except botocore.exceptions.ClientError as error:
+        # HEAD responses have no body, a 404 may also be a missing bucket
+        code = error.response["Error"]["Code"]
+        if code == "NoSuchKey" or (code == "404" and s3.check_bucket_exist(src_bucket)):
+            msg("red", f"Error: object '{src_key}' not found", 1)
+        raise
+
+    if not s3.quiet:
+        msg("green", "  - Copy completed successfully")
+
+
+def cmd_copy(s3, args):
+    """
+    Handle copy option.
+
+    Objects of a prefix are copied in parallel, while the prefix is being
+    listed.
+    """
+    import botocore.exceptions
+
+    # The buckets are not checked beforehand, only if a request fails
+    try:
+        if args.filename:
+            copy_object_in_s3(
+                s3,
+                args.src_bucket,
+                args.filename,
+                args.dst_bucket,
+                args.dst_prefix + args.filename,
+            )
+            return
+
+        # Messages of parallel copies would be interleaved, only a summary
+        # is shown at the end
+        s3.quiet = True
+        total_size = 0
+
+        def copies():
+            nonlocal total_size
+            for obj in s3.list_objects(args.src_bucket, prefix=args.prefix):
+                key, size = obj["Key"], obj["Size"]
+                total_size += size
+                dst_key = args.dst_prefix + key
+                yield s3, args.src_bucket, key, args.dst_bucket, dst_key, size
+
+        start_time = time.perf_counter()
+        count = run_parallel(copy_object_in_s3, copies(), s3.max_concurrency)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+            raise
+        for bucket in (args.src_bucket, args.dst_bucket):
+            if not s3.check_bucket_exist(bucket):
+                msg("red", f"Error: Bucket '{bucket}' does not exist", 1)
+        raise
+
+    if not count:
+        msg("yellow", f"No objects found with prefix '{args.prefix}'")
+        return
+    print_transfer_summary(
+        count, total_size, time.perf_counter() - start_time, "copied"
+    )
 
 
 ##############################################################################
@@ -946,6 +2079,11 @@ def main():
     """Command line execution."""
     global log
 
+    # Answer version checks without building the parser or importing boto3
+    if sys.argv[1:] in (["-V"], ["--version"]):
+        print_version()
+        sys.exit(0)
+
     # Parser the command line
     args = parse_parameters()
 
@@ -956,17 +2094,12 @@ def main():
     logging.getLogger("s3transfer").setLevel(logging.ERROR)
     logging.getLogger("botocore").setLevel(logging.ERROR)
     logging.getLogger("urllib3").setLevel(logging.ERROR)
-    urllib3.disable_warnings()
     # Configure log if --debug
     log = setup_logging() if args.debug else logging
     log.debug("CMD line args: %s", vars(args))
 
     try:
-        config = Config(
-            profile_name=args.aws_profile,
-            region_name=args.region_name,
-            s3_endpoint=args.endpoint,
-        )
+        config = config_from_args(args)
     except ValueError as error:
         msg("red", str(error), 1)
 
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Test bytes2human function."""
+
+import pytest
+
+from s3_client import s3_client
+
+
+@pytest.mark.parametrize(
+    "num, base, expected",
+    [
+        (0, 1024, ("0", "B")),
+        (1023, 1024, ("1023", "B")),
+        (1024, 1024, ("1.0", "KB")),
+        (1536, 1024, ("1.5", "KB")),
+        (1000, 1000, ("1.0", "KB")),
+        (999999, 1000, ("1000.0", "KB")),
+        (1048575, 1024, ("1024.0", "KB")),
+        (1024**2, 1024, ("1.0", "MB")),
+        (-2048, 1024, ("-2.0", "KB")),
+        (1536.0, 1024, ("1.5", "KB")),
+        (5 * 1024**3, 1024, ("5.0", "GB")),
+        (3 * 1024**7, 1024, ("3.0", "ZB")),
+        (2048 * 1024**7, 1024, ("2048.0", "ZB")),
+    ],
+)
+def test_bytes2human(num, base, expected):
+    assert s3_client.bytes2human(num, base) == expected
+
+
+def test_bytes2human_precision():
+    assert s3_client.bytes2human(1234567, 1000, precision=3) == ("1.235", "MB")
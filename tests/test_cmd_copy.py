@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_copy function."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from conftest import BUCKET_NAME, BUCKET_NAME_NOT_EXIST, KEY_NAMES
+
+from s3_client import s3_client
+
+DST_BUCKET = "my_dst_bucket"
+
+
+def exit_on_error(color, msg_text, exitcode=0, **kwargs):
+    """Replace msg, exiting like it does."""
+    if exitcode:
+        raise SystemExit(exitcode)
+
+
+def copy_args(**kwargs):
+    params = dict(
+        src_bucket=BUCKET_NAME,
+        dst_bucket=DST_BUCKET,
+        dst_prefix="",
+        filename=None,
+        prefix=None,
+    )
+    params.update(kwargs)
+    return MagicMock(**params)
+
+
+@pytest.fixture(scope="function")
+def dst_bucket(s3_objects):
+    s3_objects.create_bucket(Bucket=DST_BUCKET)
+    return s3_objects.Bucket(DST_BUCKET)
+
+
+def test_cmd_copy_file(s3, dst_bucket):
+    s3_client.log = Mock()
+    with patch.object(s3_client, "msg"):
+        s3_client.cmd_copy(s3, copy_args(filename="A", dst_prefix="backup/"))
+    assert [obj.key for obj in dst_bucket.objects.all()] == ["backup/A"]
+    assert dst_bucket.Object("backup/A").get()["Body"].read() == b"body"
+
+
+def test_cmd_copy_prefix(s3, dst_bucket):
+    s3_client.log = Mock()
+    with patch.object(s3_client, "msg") as mock_msg:
+        s3_client.cmd_copy(s3, copy_args(prefix="t"))
+    expected = [key for key in KEY_NAMES if key.startswith("t")]
+    assert sorted(obj.key for obj in dst_bucket.objects.all()) == expected
+    # Only the summary is printed
+    mock_msg.assert_called_once()
+    assert mock_msg.call_args.args[1].startswith(f"{len(expected)} files, ")
+
+
+def test_cmd_copy_prefix_no_objects(s3, dst_bucket):
+    with patch.object(s3_client, "msg") as mock_msg:
+        s3_client.cmd_copy(s3, copy_args(prefix="x"))
+    mock_msg.assert_called_once_with("yellow", "No objects found with prefix 'x'")
+
+
+def test_copy_object_small_and_large(s3, dst_bucket):
+    s3_client.log = Mock()
+    client = s3.client
+    with patch.object(client, "copy_object") as mock_copy_object, patch.object(
+        client, "copy"
+    ) as mock_copy:
+        s3.copy_object(BUCKET_NAME, "A", DST_BUCKET, "A", obj_size=4)
+        s3.copy_object(
+            BUCKET_NAME, "B", DST_BUCKET, "B", obj_size=s3_client.MULTIPART_SIZE
+        )
+        s3.copy_object(BUCKET_NAME, "t01", DST_BUCKET, "t01")
+    mock_copy_object.assert_called_once_with(
+        CopySource={"Bucket": BUCKET_NAME, "Key": "A"}, Bucket=DST_BUCKET, Key="A"
+    )
+    assert mock_copy.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"filename": "missing"}, "Error: object 'missing' not found"),
+        (
+            {"filename": "A", "src_bucket": BUCKET_NAME_NOT_EXIST},
+            f"Error: Bucket '{BUCKET_NAME_NOT_EXIST}' does not exist",
+        ),
+        (
+            {"filename": "A", "dst_bucket": BUCKET_NAME_NOT_EXIST},
+            f"Error: Bucket '{BUCKET_NAME_NOT_EXIST}' does not exist",
+        ),
+        (
+            {"prefix": "t", "src_bucket": BUCKET_NAME_NOT_EXIST},
+            f"Error: Bucket '{BUCKET_NAME_NOT_EXIST}' does not exist",
+        ),
+        (
+            {"prefix": "t", "dst_bucket": BUCKET_NAME_NOT_EXIST},
+            f"Error: Bucket '{BUCKET_NAME_NOT_EXIST}' does not exist",
+        ),
+    ],
+)
+def test_cmd_copy_not_found(s3, dst_bucket, params, expected):
+    s3_client.log = Mock()
+    with patch.object(s3_client, "msg", side_effect=exit_on_error) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_copy(s3, copy_args(**params))
+    mock_msg.assert_called_with("red", expected, 1)
@@ -3,6 +3,9 @@
 
 from unittest.mock import Mock, patch
 
+import botocore.exceptions
+import pytest
+
 from s3_client import s3_client
 
 
@@ -22,13 +25,17 @@ def test_cmd_delete_obj(s3):
 
 def test_cmd_delete_obj_bucket_not_exist(s3):
     """Test if bucket does not exist."""
-    s3_client.msg = Mock()
     args = Mock()
     args.bucket = "my_bucket"
     args.object = "my_object"
-    with patch.object(s3, "check_bucket_exist", return_value=False):
-        with patch.object(s3, "delete_object"):
+    error = botocore.exceptions.ClientError(
+        {"Error": {"Code": "NoSuchBucket"}}, "DeleteObjects"
+    )
+    with patch.object(s3, "delete_object", side_effect=error), patch.object(
+        s3_client, "msg", side_effect=SystemExit(1)
+    ):
+        with pytest.raises(SystemExit):
             s3_client.cmd_delete_obj(s3, args)
-            s3_client.msg.assert_called_with(
-                "red", "Error: Bucket 'my_bucket' does not exist", 1
-            )
+        s3_client.msg.assert_called_with(
+            "red", "Error: Bucket 'my_bucket' does not exist", 1
+        )
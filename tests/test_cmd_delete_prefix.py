@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_delete_prefix function."""
+
+from unittest.mock import Mock, call, patch
+
+import pytest
+from conftest import BUCKET_NAME, KEY_NAMES
+
+from s3_client import s3_client
+
+
+def test_cmd_delete_prefix(s3, s3_objects):
+    s3_client.log = Mock()
+    args = Mock(bucket=BUCKET_NAME, prefix="t")
+    with patch.object(s3_client, "msg") as mock_msg:
+        s3_client.cmd_delete_prefix(s3, args)
+    mock_msg.assert_called_once_with("green", "  - 5 objects deleted")
+    keys = [obj["Key"] for obj in s3.list_objects(BUCKET_NAME)]
+    assert keys == [key for key in KEY_NAMES if not key.startswith("t")]
+
+
+def test_cmd_delete_prefix_batches(s3):
+    args = Mock(bucket=BUCKET_NAME, prefix="p")
+    keys = [f"p{i:04d}" for i in range(2500)]
+    s3.list_objects = Mock(return_value=[{"Key": key} for key in keys])
+    s3.delete_objects = Mock(return_value={})
+    with patch.object(s3_client, "msg"):
+        s3_client.cmd_delete_prefix(s3, args)
+    assert s3.delete_objects.call_count == 3
+    s3.delete_objects.assert_has_calls(
+        [
+            call(BUCKET_NAME, keys[:1000]),
+            call(BUCKET_NAME, keys[1000:2000]),
+            call(BUCKET_NAME, keys[2000:]),
+        ],
+        any_order=True,
+    )
+
+
+def test_cmd_delete_prefix_empty_prefix(s3):
+    args = Mock(bucket=BUCKET_NAME, prefix="")
+    with patch.object(s3_client, "msg", side_effect=SystemExit(1)) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_delete_prefix(s3, args)
+    mock_msg.assert_called_once_with("red", "Error: prefix must not be empty", 1)
+
+
+def test_cmd_delete_prefix_partial_failure(s3):
+    args = Mock(bucket=BUCKET_NAME, prefix="p")
+    s3.list_objects = Mock(return_value=[{"Key": "p1"}, {"Key": "p2"}])
+    s3.delete_objects = Mock(
+        return_value={"Errors": [{"Key": "p2", "Message": "Access Denied"}]}
+    )
+    with patch.object(s3_client, "msg") as mock_msg:
+        s3_client.cmd_delete_prefix(s3, args)
+    mock_msg.assert_any_call("red", "Error: object 'p2' not deleted: Access Denied")
+    mock_msg.assert_any_call("green", "  - 1 objects deleted")
+    mock_msg.assert_called_with("red", "Error: 1 objects not deleted", 1)
+
+
+def test_cmd_delete_prefix_bucket_not_exist(s3):
+    args = Mock(bucket="my_bucket", prefix="t")
+    with patch.object(s3_client, "msg", side_effect=SystemExit(1)) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_delete_prefix(s3, args)
+    mock_msg.assert_called_once_with(
+        "red", "Error: Bucket 'my_bucket' does not exist", 1
+    )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_download function."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from s3_client import s3_client
+
+
+def exit_on_error(color, msg_text, exitcode=0, **kwargs):
+    """Replace msg, exiting like it does."""
+    if exitcode:
+        raise SystemExit(exitcode)
+
+
+@pytest.mark.parametrize("filename, prefix", [("my_object", None), (None, "my_prefix")])
+def test_cmd_download_bucket_not_exist(s3, tmp_path, filename, prefix):
+    args = MagicMock(
+        bucket="my_bucket",
+        filename=filename,
+        prefix=prefix,
+        localdir=str(tmp_path),
+        versionid=None,
+        overwrite=False,
+        nopbar=True,
+    )
+    s3_client.log = Mock()
+    with patch.object(s3_client, "create_dir"), patch.object(
+        s3_client, "msg", side_effect=exit_on_error
+    ) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_download(s3, args)
+    mock_msg.assert_called_with("red", "Error: Bucket 'my_bucket' does not exist", 1)
+
+
+def test_cmd_download_object_not_exist(s3, s3_bucket, tmp_path):
+    args = MagicMock(
+        bucket="my_bucket",
+        filename="my_object",
+        prefix=None,
+        localdir=str(tmp_path),
+        versionid=None,
+        overwrite=False,
+        nopbar=True,
+    )
+    s3_client.log = Mock()
+    with patch.object(s3_client, "create_dir"), patch.object(
+        s3_client, "msg", side_effect=exit_on_error
+    ) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_download(s3, args)
+    mock_msg.assert_called_with("red", "Error:  object 'my_object' not found.", 1)
+
+
+def test_download_file_no_such_key(s3, s3_bucket, tmp_path):
+    """A small object deleted after listing is fetched by GetObject (NoSuchKey)."""
+    download = s3_client.Download(s3, "my_bucket", str(tmp_path))
+    with patch.object(s3_client, "msg", side_effect=exit_on_error) as mock_msg:
+        with pytest.raises(SystemExit):
+            download.download_file("my_object", False, obj_size=4)
+    mock_msg.assert_called_with("red", "Error:  object 'my_object' not found.", 1)
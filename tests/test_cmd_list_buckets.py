@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_list_buckets function."""
+
+from unittest.mock import MagicMock, Mock
+
+from s3_client import s3_client
+
+BUCKET_NAMES = ["bucket-{:02d}".format(i) for i in range(20)]
+
+
+def test_cmd_list_buckets_keeps_order(s3, s3_bucket, capsys):
+    s3_client.log = Mock()
+    s3_bucket.meta.client.delete_bucket(Bucket="my_bucket")
+    for name in BUCKET_NAMES:
+        s3_bucket.create_bucket(Bucket=name)
+    s3_bucket.BucketVersioning("bucket-05").enable()
+    s3.max_concurrency = 4
+    s3_client.cmd_list_buckets(s3, MagicMock(acl=True))
+    lines = [line for line in capsys.readouterr().out.splitlines() if "name" in line]
+    assert [line.split()[1] for line in lines] == BUCKET_NAMES
+    assert lines[5].endswith("Enabled")
+    assert lines[0].endswith("None")
+
+
+def test_cmd_list_buckets_no_buckets(s3, capsys):
+    s3_client.cmd_list_buckets(s3, MagicMock(acl=False))
+    assert capsys.readouterr().out == ""
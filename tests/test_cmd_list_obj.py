@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_list_obj function."""
+
+import operator
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from conftest import BUCKET_NAME, KEY_NAMES
+
+from s3_client import s3_client
+
+
+def list_obj_args(**kwargs):
+    params = dict(bucket=BUCKET_NAME, prefix=None, limit=None, versions=False)
+    params.update(kwargs)
+    return MagicMock(**params)
+
+
+def test_cmd_list_obj_table(s3, s3_objects, capsys):
+    s3_client.log = Mock()
+    s3_client.cmd_list_obj(s3, list_obj_args(table=True))
+    lines = capsys.readouterr().out.splitlines()
+    for attr in s3_client.OBJECT_ATTRS:
+        assert attr in lines[0]
+    # header, separator and one line per object
+    assert len(lines) == len(KEY_NAMES) + 2
+    assert lines[2].startswith("| A ")
+    assert "| 4 B " in lines[2]
+
+
+def test_cmd_list_obj_lines(s3, s3_objects, capsys):
+    s3_client.log = Mock()
+    s3_client.cmd_list_obj(s3, list_obj_args(table=False, limit=2))
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith(s3_client.format_attrs(("key", "size"), ("A", 4)))
+
+
+def test_cmd_list_obj_bucket_not_exist(s3):
+    s3_client.log = Mock()
+    with patch.object(s3_client, "msg", side_effect=SystemExit(1)) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_list_obj(s3, list_obj_args(table=False))
+    mock_msg.assert_called_once_with(
+        "red", "Error: Bucket '{}' does not exist".format(BUCKET_NAME), 1
+    )
+
+
+def test_print_objects_table_chunks(capsys):
+    objects = [{"key": f"key{i}", "size": i} for i in range(5)]
+    attrs = ("key", "size")
+    get_attrs = operator.itemgetter(*attrs)
+    s3_client.print_objects_table(objects, attrs, get_attrs)
+    expected = capsys.readouterr().out
+    with patch.object(s3_client, "TABLE_CHUNK_ROWS", 2):
+        s3_client.print_objects_table(iter(objects), attrs, get_attrs)
+    assert capsys.readouterr().out == expected
+    # header, separator and one line per object
+    assert len(expected.splitlines()) == len(objects) + 2
+
+
+def test_cmd_list_obj_versions_table(s3, s3_bucket, capsys):
+    s3_bucket.BucketVersioning(BUCKET_NAME).enable()
+    s3_bucket.Object(BUCKET_NAME, "key1").put(Body="body")
+    s3_bucket.Object(BUCKET_NAME, "key1").delete()
+    s3_client.cmd_list_obj(s3, list_obj_args(table=True, versions=True))
+    lines = capsys.readouterr().out.splitlines()
+    for attr in s3_client.OBJECT_VERSION_ATTRS:
+        assert attr in lines[0]
+    # header, separator, the version and the delete marker
+    assert len(lines) == 4
+    assert sum("| 4 B " in line for line in lines) == 1
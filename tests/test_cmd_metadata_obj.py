@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Test cmd_metadata_obj function."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import BUCKET_NAME, BUCKET_NAME_NOT_EXIST, KEY_NAMES
+
+from s3_client import s3_client
+
+
+def exit_on_error(color, msg_text, exitcode=0, **kwargs):
+    """Replace msg, exiting like it does."""
+    if exitcode:
+        raise SystemExit(exitcode)
+
+
+def test_cmd_metadata_obj(s3, s3_objects, capsys):
+    args = Mock(bucket=BUCKET_NAME, object=KEY_NAMES[0])
+    s3.check_bucket_exist = Mock()
+    s3_client.cmd_metadata_obj(s3, args)
+    assert json.loads(capsys.readouterr().out)["ContentLength"] == len("body")
+    # No HEAD request for the bucket
+    s3.check_bucket_exist.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "bucket, expected",
+    [
+        (BUCKET_NAME, "Error: key 'missing' not found"),
+        (
+            BUCKET_NAME_NOT_EXIST,
+            f"Error: Bucket '{BUCKET_NAME_NOT_EXIST}' does not exist",
+        ),
+    ],
+)
+def test_cmd_metadata_obj_not_found(s3, s3_bucket, bucket, expected):
+    s3_client.log = Mock()
+    args = Mock(bucket=bucket, object="missing")
+    with patch.object(s3_client, "msg", side_effect=exit_on_error) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_metadata_obj(s3, args)
+    mock_msg.assert_called_once_with("red", expected, 1)
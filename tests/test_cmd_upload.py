@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 """Test cmd_upload function."""
 
+import argparse
 import os
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
+
 from s3_client import s3_client
 
 
+def exit_on_error(color, msg_text, exitcode=0, **kwargs):
+    """Replace msg, exiting like it does."""
+    if exitcode:
+        raise SystemExit(exitcode)
+
+
 def test_cmd_upload_file(s3, tmp_filename):
     """
     Test cmd_upload function to ensure it handles file uploads correctly.
@@ -18,8 +27,10 @@ def test_cmd_upload_file(s3, tmp_filename):
         nopbar=True,
         nokeepdir=False,
         prefix="",
+        processes=0,
     )
     s3_client.log = Mock()
+    s3.check_bucket_exist = Mock(return_value=True)
     with patch("s3_client.s3_client.upload_file_to_s3") as mock_upload:
         s3_client.cmd_upload(s3, args)
         mock_upload.assert_called_once()
@@ -41,8 +52,10 @@ def test_cmd_upload_directory(s3, tmp_filename):
         nopbar=True,
         nokeepdir=False,
         prefix="",
+        processes=0,
     )
     s3_client.log = Mock()
+    s3.check_bucket_exist = Mock(return_value=True)
     with patch("s3_client.s3_client.upload_file_to_s3") as mock_upload:
         s3_client.cmd_upload(s3, args)
         called_args, _ = mock_upload.call_args
@@ -66,11 +79,224 @@ def test_cmd_upload_directory_two_files(s3, directory_with_two_files):
         nopbar=True,
         nokeepdir=False,
         prefix="",
+        processes=0,
     )
 
     s3_client.log = Mock()
+    s3.check_bucket_exist = Mock(return_value=True)
     with patch("s3_client.s3_client.upload_file_to_s3") as mock_upload:
         s3_client.cmd_upload(s3, args)
         assert mock_upload.call_count == 2
-        mock_upload.assert_any_call(s3, "test-bucket", str(file1), str(file1))
-        mock_upload.assert_any_call(s3, "test-bucket", str(file2), str(file2))
+        for file in (file1, file2):
+            mock_upload.assert_any_call(
+                s3, "test-bucket", str(file), str(file), file.stat().st_size
+            )
+
+
+def test_cmd_upload_empty_directory(s3, tmp_path):
+    """
+    Test cmd_upload function with a directory without files.
+    """
+    args = MagicMock(
+        bucket="test-bucket",
+        dir=str(tmp_path),
+        filename=None,
+        nopbar=True,
+        nokeepdir=False,
+        prefix="",
+        processes=0,
+    )
+
+    s3_client.log = Mock()
+    s3.check_bucket_exist = Mock(return_value=True)
+    with patch("s3_client.s3_client.upload_file_to_s3") as mock_upload, patch(
+        "s3_client.s3_client.msg"
+    ) as mock_msg:
+        s3_client.cmd_upload(s3, args)
+        mock_upload.assert_not_called()
+        mock_msg.assert_called_once_with(
+            "yellow", f"No files found in directory '{tmp_path}'"
+        )
+
+
+def test_cmd_upload_directory_summary(s3, s3_bucket, directory_with_two_files):
+    """
+    Test cmd_upload prints only a summary when uploading a directory.
+    """
+    tmp_path, file1, file2 = directory_with_two_files
+
+    args = MagicMock(
+        bucket="my_bucket",
+        dir=str(tmp_path),
+        filename=None,
+        nopbar=False,
+        nokeepdir=True,
+        prefix="",
+        processes=0,
+    )
+
+    s3_client.log = Mock()
+    with patch("s3_client.s3_client.msg") as mock_msg:
+        s3_client.cmd_upload(s3, args)
+    mock_msg.assert_called_once()
+    color, text = mock_msg.call_args.args
+    assert color == "green"
+    assert text.startswith("2 files, 18 B uploaded in ")
+    keys = [obj.key for obj in s3_bucket.Bucket("my_bucket").objects.all()]
+    assert keys == ["file1.txt", "file2.txt"]
+
+
+def test_upload_with_processes(s3_bucket, directory_with_two_files):
+    """
+    Test upload_with_processes uploads files from worker processes.
+    """
+    tmp_path, file1, file2 = directory_with_two_files
+    args = argparse.Namespace(
+        processes=2,
+        debug=False,
+        aws_profile=None,
+        region_name=None,
+        endpoint=None,
+        max_concurrency=2,
+        ca_bundle=None,
+        part_size=64,
+        part_concurrency=None,
+        accelerate=False,
+        dualstack=False,
+    )
+    uploads = [("my_bucket", str(file1), "file1"), ("my_bucket", str(file2), "file2")]
+    assert s3_client.upload_with_processes(args, iter(uploads)) == 2
+
+
+def test_upload_file_in_worker_error(tmp_path):
+    """
+    Test upload_file_in_worker returns the exit code instead of exiting.
+    """
+    s3_client.worker_s3 = Mock(quiet=True)
+    s3_client.worker_s3.upload_file.side_effect = FileNotFoundError
+    upload = ("b", str(tmp_path / "x"), "x")
+    with patch.object(s3_client, "worker_failure", None), patch.object(
+        s3_client, "msg", side_effect=SystemExit(1)
+    ):
+        assert s3_client.upload_file_in_worker(upload) == (1, None)
+        # The next files of the worker are skipped
+        s3_client.worker_s3.upload_file.reset_mock()
+        assert s3_client.upload_file_in_worker(upload) == (1, None)
+    s3_client.worker_s3.upload_file.assert_not_called()
+
+
+def test_upload_with_processes_init_error(directory_with_two_files):
+    """
+    Test upload_with_processes exits when the workers cannot be initialized.
+    """
+    tmp_path, file1, file2 = directory_with_two_files
+    args = argparse.Namespace(
+        processes=2,
+        debug=False,
+        aws_profile=None,
+        region_name=None,
+        endpoint=None,
+        max_concurrency=2,
+        ca_bundle=None,
+        # Below the S3 minimum, Config raises ValueError
+        part_size=1,
+        part_concurrency=None,
+        accelerate=False,
+        dualstack=False,
+    )
+    uploads = [("my_bucket", str(file1), "file1"), ("my_bucket", str(file2), "file2")]
+    with patch.object(s3_client, "msg") as mock_msg:
+        with pytest.raises(SystemExit) as exc:
+            s3_client.upload_with_processes(args, iter(uploads))
+    assert exc.value.code == 1
+    mock_msg.assert_called_once_with(
+        "red", "Part size must be at least 5 MiB (S3 limit)"
+    )
+
+
+@pytest.mark.parametrize("threshold", [s3_client.SMALL_OBJECT_THRESHOLD, 0])
+def test_cmd_upload_bucket_not_exist(s3, tmp_filename, threshold):
+    """
+    Test cmd_upload reports a missing bucket from the upload error.
+    """
+    args = MagicMock(
+        bucket="my_bucket",
+        filename=tmp_filename,
+        dir=None,
+        nopbar=True,
+        nokeepdir=False,
+        prefix="",
+        processes=0,
+    )
+    s3_client.log = Mock()
+    s3.small_object_threshold = threshold
+    with patch("s3_client.s3_client.msg", side_effect=exit_on_error) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_upload(s3, args)
+    mock_msg.assert_called_with("red", "Error: Bucket 'my_bucket' does not exist", 1)
+
+
+@pytest.mark.parametrize(
+    "relative_dir, prefix", [(False, ""), (True, ""), (False, "backup/2024/")]
+)
+def test_cmd_upload_directory_interleaved(
+    s3, tmp_path, monkeypatch, relative_dir, prefix
+):
+    """
+    Test cmd_upload mixes the subdirectories of the uploaded directory.
+    """
+    for subdir in ("a", "b"):
+        (tmp_path / "data" / subdir).mkdir(parents=True)
+        for i in range(3):
+            (tmp_path / "data" / subdir / f"file{i}").write_text("content")
+    if relative_dir:
+        monkeypatch.chdir(tmp_path)
+        directory = "./data"
+    else:
+        directory = str(tmp_path / "data")
+    args = MagicMock(
+        bucket="test-bucket",
+        dir=directory,
+        filename=None,
+        nopbar=True,
+        nokeepdir=False,
+        prefix=prefix,
+        processes=0,
+    )
+    s3.max_concurrency = 1
+    with patch.object(s3_client, "upload_file_to_s3") as mock_upload, patch.object(
+        s3_client, "msg"
+    ):
+        s3_client.cmd_upload(s3, args)
+
+    object_names = [upload.args[3] for upload in mock_upload.call_args_list]
+    assert all(name.startswith(prefix + directory) for name in object_names)
+    subdirs = [
+        os.path.relpath(upload.args[2], directory).split(os.sep)[0]
+        for upload in mock_upload.call_args_list
+    ]
+    assert sorted(subdirs) == ["a"] * 3 + ["b"] * 3
+    assert all(first != second for first, second in zip(subdirs, subdirs[1:]))
+
+
+def test_cmd_upload_directory_bucket_not_exist(s3, directory_with_two_files):
+    """
+    Test cmd_upload reports a missing bucket once for a directory.
+    """
+    tmp_path, _, _ = directory_with_two_files
+    args = MagicMock(
+        bucket="my_bucket",
+        filename=None,
+        dir=str(tmp_path),
+        nopbar=True,
+        nokeepdir=False,
+        prefix="",
+        processes=0,
+    )
+    s3_client.log = Mock()
+    with patch.object(s3_client, "msg", side_effect=exit_on_error) as mock_msg:
+        with pytest.raises(SystemExit):
+            s3_client.cmd_upload(s3, args)
+    mock_msg.assert_called_once_with(
+        "red", "Error: Bucket 'my_bucket' does not exist", 1
+    )
@@ -26,18 +26,52 @@ def test_config_env_var(mock_env_vars):
     assert session.get_credentials().token == "my_aws_token"
 
 
-@pytest.mark.parametrize("envvar", [("AWS_ACCESS_KEY_ID"), ("AWS_SECRET_ACCESS_KEY")])
-def test_config_missing_env_var(mock_env_vars, monkeypatch, envvar):
+@pytest.fixture
+def no_credentials_files(monkeypatch, tmp_path):
+    """Hide shared credentials files and instance metadata from boto3"""
+    monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "credentials"))
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path / "config"))
+    monkeypatch.setenv("AWS_EC2_METADATA_DISABLED", "true")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+
+def test_config_no_credentials(mock_env_vars, no_credentials_files, monkeypatch):
+    """Check config without any credentials"""
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID")
+    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY")
+    with pytest.raises(ValueError, match="Could not find AWS credentials"):
+        config = s3_client.Config()
+
+
+@pytest.mark.parametrize(
+    "envvar, error",
+    [
+        ("AWS_ACCESS_KEY_ID", "Could not find AWS credentials"),
+        ("AWS_SECRET_ACCESS_KEY", "Partial AWS credentials found"),
+    ],
+)
+def test_config_missing_env_var(
+    mock_env_vars, no_credentials_files, monkeypatch, envvar, error
+):
     """Check config missing env var"""
     # Delete env
     monkeypatch.delenv(envvar, raising=False)
-    with pytest.raises(
-        ValueError,
-        match="AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY must be set in environment variables.",
-    ):
+    with pytest.raises(ValueError, match=error):
         config = s3_client.Config()
 
 
+def test_config_shared_credentials_file(no_credentials_files, monkeypatch, tmp_path):
+    """Check config reads the default profile of the credentials file"""
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    (tmp_path / "credentials").write_text(
+        "[default]\naws_access_key_id = file_key\naws_secret_access_key = secret\n"
+    )
+    config = s3_client.Config()
+    assert config.get_session().get_credentials().access_key == "file_key"
+
+
 def test_config_initialization(mock_env_vars):
     test_region = "my_region"
     test_endpoint = "https://s3mycompany.com"
@@ -55,3 +89,26 @@ def test_config_profile_and_region(mock_env_vars):
         MockSession.assert_called_once_with(
             profile_name=test_profile, region_name=test_region
         )
+
+
+def test_config_max_concurrency(mock_env_vars):
+    assert s3_client.Config().max_concurrency == s3_client.DEFAULT_MAX_CONCURRENCY
+    assert s3_client.Config(max_concurrency=4).max_concurrency == 4
+
+
+def test_config_ca_bundle(mock_env_vars):
+    assert s3_client.Config().ca_bundle is None
+    assert s3_client.Config(ca_bundle="/ca.pem").ca_bundle == "/ca.pem"
+
+
+def test_config_part_size(mock_env_vars):
+    assert s3_client.Config().part_size == s3_client.MULTIPART_SIZE
+    assert s3_client.Config(part_size=8 * s3_client.MIB).part_size == 8 * s3_client.MIB
+    with pytest.raises(ValueError, match="Part size must be at least 5 MiB"):
+        s3_client.Config(part_size=s3_client.MIN_PART_SIZE - 1)
+
+
+def test_config_part_concurrency(mock_env_vars):
+    assert s3_client.Config(part_concurrency=3).part_concurrency == 3
+    assert s3_client.Config(max_concurrency=100).part_concurrency == 100
+    assert s3_client.Config(max_concurrency=1).part_concurrency >= 10
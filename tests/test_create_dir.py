@@ -9,45 +9,37 @@ dir_name = "mydirtest"
 
 
 @patch("os.makedirs", autospec=True)
-@patch("os.path.exists", autospec=True)
-def test_create_dir(mock_exists, mock_makedirs):
+def test_create_dir(mock_makedirs):
     """Test directory creation."""
-    mock_exists.return_value = False
     s3_client.create_dir(dir_name)
-    mock_makedirs.assert_called_once_with(dir_name)
+    mock_makedirs.assert_called_once_with(dir_name, exist_ok=True)
 
 
-@patch("os.makedirs", autospec=True)
-@patch("os.path.isfile", autospec=True)
-@patch("os.path.exists", autospec=True)
-def test_create_dir_already_exist(mock_exists, mock_isfile, mock_makedirs):
-    """Test not try to create directory if it already exist."""
-    mock_exists.return_value = True
-    mock_isfile.return_value = False
-    s3_client.create_dir("mydirtest")
-    mock_makedirs.assert_not_called()
+def test_create_dir_already_exist(tmp_path):
+    """Test no error if directory already exist."""
+    with patch("s3_client.s3_client.msg") as mock_msg:
+        s3_client.create_dir(str(tmp_path))
+        s3_client.create_dir(str(tmp_path / "a" / "b"))
+        s3_client.create_dir(str(tmp_path / "a" / "b"))
+    mock_msg.assert_not_called()
+    assert (tmp_path / "a" / "b").is_dir()
 
 
 @patch("s3_client.s3_client.msg")
-@patch("os.makedirs", autospec=True)
-@patch("os.path.isfile", autospec=True)
-@patch("os.path.exists", autospec=True)
-def test_create_dir_exist_but_file(mock_exists, mock_isfile, mock_makedirs, mock_msg):
+def test_create_dir_exist_but_file(mock_msg, tmp_path):
     """Test error if path exist but is a file."""
-    mock_exists.return_value = True
-    mock_isfile.return_value = True
-    s3_client.create_dir(dir_name)
+    file_name = tmp_path / "file"
+    file_name.write_text("file")
+    s3_client.create_dir(str(file_name))
     mock_msg.assert_called_once_with(
-        "red", "Error: path {} exists and is not a directory".format(dir_name), 1
+        "red", "Error: path {} exists and is not a directory".format(file_name), 1
     )
 
 
 @patch("s3_client.s3_client.msg")
 @patch("os.makedirs", autospec=True)
-@patch("os.path.exists", autospec=True)
-def test_create_dir_path_is_file(mock_exists, mock_makedirs, mock_msg):
+def test_create_dir_path_is_file(mock_makedirs, mock_msg):
     """Test permission denied error to create dir."""
-    mock_exists.return_value = False
     mock_makedirs.side_effect = PermissionError
     s3_client.create_dir(dir_name)
     mock_msg.assert_called_once_with(
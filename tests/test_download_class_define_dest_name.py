@@ -23,6 +23,8 @@ import pytest
         ("/x/y", "/a", "/x/y/a"),
         ("/x/y/", "/a", "/x/y/a"),
         ("/x/y/.", "/a", "/x/y/./a"),
+        ("dir", "//a", "dir/a"),
+        ("dir", "a/b/c", "dir/a/b/c"),
     ],
 )
 def test_build_dest_name(download, localdir, objectname, result):
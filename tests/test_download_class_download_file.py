@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 """Test Download class."""
 
-from unittest.mock import Mock
+import errno
+from unittest.mock import Mock, patch
 
 from conftest import TMP_FILENAME
 
@@ -20,7 +21,7 @@ def test_download_file(download, tmp_filename):
     download.define_dest_name.return_value = dest_name
     download.download_file(obj_name, True)
     download.s3.download_object.assert_called_once_with(
-        download.bucket_name, obj_name, dest_name, None
+        download.bucket_name, obj_name, dest_name, None, obj_size=None
     )
 
 
@@ -38,6 +39,20 @@ def test_download_file_permissionerror(download):
     )
 
 
+def test_download_file_no_disk_space(download):
+    s3_client.msg = Mock()
+    s3_client.create_dir = Mock()
+    dest_name = "/tmp/myfile"
+    download.define_dest_name = Mock(return_value=dest_name)
+    download.s3 = Mock()
+    error = OSError(errno.ENOSPC, "Not enough disk space", dest_name)
+    download.s3.download_object = Mock(side_effect=error)
+    download.download_file(TMP_FILENAME, True)
+    s3_client.msg.assert_any_call(
+        "red", "Error: Not enough disk space to write file {}".format(dest_name), 1
+    )
+
+
 def test_download_file_not_overwrite(download, tmp_filename):
     obj_name = TMP_FILENAME
     dest_name = str(tmp_filename)
@@ -62,3 +77,31 @@ def test_download_file_overwrite(download, tmp_filename):
     download.define_dest_name.return_value = dest_name
     download.download_file(obj_name, True)
     download.check_file_exist.assert_not_called()
+
+
+def test_download_file_quiet(download, tmp_filename):
+    download.s3 = Mock(quiet=True)
+    download.define_dest_name = Mock(return_value=str(tmp_filename))
+    with patch.object(s3_client, "msg") as mock_msg, patch.object(
+        s3_client, "create_dir"
+    ):
+        download.download_file(TMP_FILENAME, True)
+    mock_msg.assert_not_called()
+    download.s3.quiet = False
+    with patch.object(s3_client, "msg") as mock_msg, patch.object(
+        s3_client, "create_dir"
+    ):
+        download.download_file(TMP_FILENAME, True)
+    assert mock_msg.call_count == 2
+
+
+def test_download_file_creates_dir_once(download, tmp_path):
+    download.s3 = Mock(quiet=True)
+    download.local_dir = str(tmp_path)
+    with patch.object(s3_client, "create_dir") as mock_create_dir:
+        download.download_file("dir/obj1", True)
+        download.download_file("dir/obj2", True)
+        download.download_file("other/obj1", True)
+    assert mock_create_dir.call_count == 2
+    mock_create_dir.assert_any_call(str(tmp_path / "dir"))
+    mock_create_dir.assert_any_call(str(tmp_path / "other"))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Test Download class."""
+
+from unittest.mock import Mock, call, patch
+
+from conftest import KEY_NAMES
+
+from s3_client import s3_client
+
+
+def test_download_prefix(download):
+    download.s3 = Mock(max_concurrency=2)
+    download.s3.list_objects.return_value = [
+        {"Key": key, "Size": 4} for key in KEY_NAMES
+    ]
+    download.download_file = Mock()
+    with patch.object(s3_client, "msg") as mock_msg:
+        download.download_prefix("t", True)
+    download.s3.list_objects.assert_called_once_with(download.bucket_name, prefix="t")
+    assert download.s3.quiet is True
+    assert download.download_file.call_count == len(KEY_NAMES)
+    download.download_file.assert_has_calls(
+        [call(key, True, obj_size=4) for key in KEY_NAMES], any_order=True
+    )
+    # Only the summary is printed
+    mock_msg.assert_called_once()
+    color, text = mock_msg.call_args.args
+    assert color == "green"
+    size = " ".join(s3_client.bytes2human(4 * len(KEY_NAMES)))
+    assert text.startswith(f"{len(KEY_NAMES)} files, {size} downloaded in ")
+
+
+def test_download_prefix_no_objects(download):
+    s3_client.msg = Mock()
+    download.s3 = Mock(max_concurrency=2)
+    download.s3.list_objects.return_value = iter([])
+    download.download_file = Mock()
+    download.download_prefix("t", True)
+    download.download_file.assert_not_called()
+    s3_client.msg.assert_called_once_with("yellow", "No objects found with prefix 't'")
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Test format_attrs function."""
+
+from unittest.mock import patch
+
+from s3_client import s3_client
+
+
+def test_format_attrs():
+    with patch.object(s3_client, "MSG_TEMPLATES", s3_client.COLOR_TEMPLATES):
+        line = s3_client.format_attrs(("key", "size"), ("A", 4))
+    assert line == "\033[0;36mkey\033[0m: A \033[0;36msize\033[0m: 4"
+
+
+def test_format_attrs_no_colors():
+    templates = dict.fromkeys(s3_client.COLOR_TEMPLATES, "{}")
+    with patch.object(s3_client, "MSG_TEMPLATES", templates):
+        line = s3_client.format_attrs(("key", "size"), ("A", 4))
+    assert line == "key: A size: 4"
+
+
+def test_format_attrs_empty():
+    assert s3_client.format_attrs((), ()) == ""
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Test interleave_by_prefix function."""
+
+import pytest
+
+from s3_client import s3_client
+
+NAMES = ["a/x/1", "a/x/2", "a/x/3", "a/y/1", "b/x/1", "b/x/2", "c"]
+
+
+@pytest.mark.parametrize(
+    "depth, window, expected",
+    [
+        (1, None, ["a/x/1", "b/x/1", "c", "a/x/2", "b/x/2", "a/x/3", "a/y/1"]),
+        (2, None, ["a/x/1", "a/y/1", "b/x/1", "c", "a/x/2", "b/x/2", "a/x/3"]),
+        (1, 3, ["a/x/1", "a/x/2", "a/x/3", "a/y/1", "b/x/1", "b/x/2", "c"]),
+    ],
+)
+def test_interleave_by_prefix(depth, window, expected):
+    result = s3_client.interleave_by_prefix(NAMES, depth=depth, window=window)
+    assert list(result) == expected
+
+
+def test_interleave_by_prefix_key():
+    items = [(1, "a/1"), (2, "a/2"), (3, "b/1")]
+    result = s3_client.interleave_by_prefix(items, lambda item: item[1], depth=1)
+    assert list(result) == [(1, "a/1"), (3, "b/1"), (2, "a/2")]
+
+
+def test_interleave_by_prefix_empty():
+    assert list(s3_client.interleave_by_prefix(iter([]))) == []
+
+
+def test_interleave_by_prefix_file_name_not_in_prefix():
+    names = ["a/1", "a/2", "b/1", "b/2"]
+    result = s3_client.interleave_by_prefix(names, depth=2)
+    assert list(result) == ["a/1", "b/1", "a/2", "b/2"]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Test iter_files function."""
+
+import errno
+import os
+from unittest.mock import patch
+
+from s3_client import s3_client
+
+
+def test_iter_files(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "empty").mkdir()
+    expected = [
+        tmp_path / "file0",
+        tmp_path / "a" / "file1",
+        tmp_path / "a" / "b" / "file2",
+    ]
+    for file in expected:
+        file.write_text("content")
+    os.symlink(tmp_path / "a", tmp_path / "link_to_dir")
+
+    result = sorted(entry.path for entry in s3_client.iter_files(str(tmp_path)))
+
+    assert result == sorted(str(file) for file in expected)
+
+
+def test_iter_files_unreadable_directory(tmp_path):
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "file1").write_text("content")
+    (tmp_path / "file0").write_text("content")
+    scandir = os.scandir
+
+    def fake_scandir(path):
+        if path.endswith("locked"):
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return scandir(path)
+
+    with patch.object(s3_client.os, "scandir", side_effect=fake_scandir), patch.object(
+        s3_client, "msg"
+    ) as mock_msg:
+        result = [entry.path for entry in s3_client.iter_files(str(tmp_path))]
+
+    assert result == [str(tmp_path / "file0")]
+    mock_msg.assert_called_once_with(
+        "yellow",
+        f"Warning: skipping directory '{tmp_path / 'locked'}': Permission denied",
+    )
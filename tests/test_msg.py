@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Test msg function."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from s3_client import s3_client
+
+# Other tests replace s3_client.msg with a Mock, keep the real function
+msg = s3_client.msg
+
+
+@pytest.fixture(autouse=True)
+def use_colors(monkeypatch):
+    """Output is captured by pytest, force colors"""
+    monkeypatch.setattr(s3_client, "MSG_TEMPLATES", s3_client.COLOR_TEMPLATES)
+
+
+@pytest.mark.parametrize(
+    "color, expected",
+    [
+        ("nocolor", "text\n"),
+        (None, "text\n"),
+        ("red", "\033[1;31mtext\033[0m\n"),
+        ("cyan", "\033[0;36mtext\033[0m\n"),
+    ],
+)
+def test_msg(color, expected):
+    output = io.StringIO()
+    msg(color, "text", output=output)
+    assert output.getvalue() == expected
+
+
+def test_msg_end_and_non_str():
+    output = io.StringIO()
+    msg("green", 4, end=" ", flush=False, output=output)
+    assert output.getvalue() == "\033[0;32m4\033[0m "
+
+
+def test_msg_invalid_color():
+    with pytest.raises(ValueError):
+        msg("pink", "text", output=io.StringIO())
+
+
+def test_msg_exitcode():
+    with pytest.raises(SystemExit) as exc:
+        msg("red", "error", 2, output=io.StringIO())
+    assert exc.value.code == 2
+
+
+def test_msg_no_colors(monkeypatch):
+    templates = dict.fromkeys(s3_client.COLOR_TEMPLATES, "{}")
+    monkeypatch.setattr(s3_client, "MSG_TEMPLATES", templates)
+    output = io.StringIO()
+    msg("red", "text", output=output)
+    assert output.getvalue() == "text\n"
+    with pytest.raises(ValueError):
+        msg("pink", "text", output=io.StringIO())
+
+
+@pytest.mark.parametrize(
+    "isatty, no_color, expected",
+    [(True, "", True), (True, "1", False), (False, "", False)],
+)
+def test_use_colors(isatty, no_color, expected):
+    """USE_COLORS is computed at import, run it in a new interpreter"""
+    code = (
+        "import sys; sys.stdout.isatty = lambda: {}; "
+        "from s3_client import s3_client; print(s3_client.USE_COLORS)"
+    ).format(isatty)
+    env = dict(os.environ, NO_COLOR=no_color)
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == str(expected)
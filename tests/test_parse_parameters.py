@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Test command line parser."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from s3_client import __version__, s3_client
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["listbuckets"], "listbuckets"),
+        (["-d", "listobj", "my_bucket"], "listobj"),
+        (["-e", "https://s3.amazonaws.com", "upload", "my_bucket"], "upload"),
+        (["--endpoint=https://s3.amazonaws.com", "download", "b"], "download"),
+        (["-r", "us-east-1", "--profile", "dev", "listbuckets"], "listbuckets"),
+        (["-h"], None),
+        ([], None),
+        (["--max-concurrency", "abc", "listbuckets"], None),
+        (["-e"], None),
+    ],
+)
+def test_sniff_subcommand(argv, expected):
+    assert s3_client.sniff_subcommand(argv) == expected
+
+
+def test_parse_parameters_only_builds_command(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["s3_client", "listobj", "my_bucket", "-t"])
+    mock_upload = Mock()
+    with patch.dict(s3_client.COMMANDS, {"upload": ("Upload", mock_upload)}):
+        args = s3_client.parse_parameters()
+    mock_upload.assert_not_called()
+    assert args.command == "listobj"
+    assert args.bucket == "my_bucket"
+    assert args.table is True
+    assert args.func is s3_client.cmd_list_obj
+
+
+@pytest.mark.parametrize("argv", [["-V"], ["--version"], ["-d", "--version"]])
+def test_version(monkeypatch, capsys, argv):
+    monkeypatch.setattr("sys.argv", ["s3_client"] + argv)
+    with patch.object(s3_client, "parse_parameters", wraps=s3_client.parse_parameters):
+        with pytest.raises(SystemExit) as exc:
+            s3_client.main()
+        # Only the version option alone skips the parser
+        assert s3_client.parse_parameters.called == (len(argv) > 1)
+    assert exc.value.code == 0
+    assert capsys.readouterr().out == __version__ + "\n"
+
+
+def test_parse_parameters_cacert(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["s3_client", "--cacert", "/ca.pem", "listbuckets"])
+    assert s3_client.parse_parameters().ca_bundle == "/ca.pem"
+
+
+def test_parse_parameters_part_options(monkeypatch):
+    argv = ["s3_client", "--part-size", "8", "--part-concurrency", "3", "listbuckets"]
+    monkeypatch.setattr("sys.argv", argv)
+    args = s3_client.parse_parameters()
+    assert args.part_size == 8
+    assert args.part_concurrency == 3
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "abc"])
+def test_parse_parameters_part_concurrency_invalid(monkeypatch, capsys, value):
+    argv = ["s3_client", "--part-concurrency", value, "listbuckets"]
+    monkeypatch.setattr("sys.argv", argv)
+    with pytest.raises(SystemExit) as exc:
+        s3_client.parse_parameters()
+    assert exc.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+
+
+def test_main_part_size_mib(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["s3_client", "--part-size", "8"])
+    with patch.object(s3_client, "Config") as mock_config, patch.object(
+        s3_client, "S3"
+    ):
+        s3_client.main()
+    kwargs = mock_config.call_args.kwargs
+    assert kwargs["part_size"] == 8 * s3_client.MIB
+    assert kwargs["part_concurrency"] is None
+
+
+def test_parse_parameters_invalid_global_option(monkeypatch, capsys):
+    monkeypatch.setattr(
+        "sys.argv", ["s3_client", "--max-concurrency", "abc", "listobj"]
+    )
+    with pytest.raises(SystemExit) as exc:
+        s3_client.parse_parameters()
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert err.count("error:") == 1
+    assert "--max-concurrency" in err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["s3_client", "--max-concurrency", "0", "listbuckets"],
+        ["s3_client", "upload", "my_bucket", "-d", ".", "--processes", "-2"],
+    ],
+)
+def test_parse_parameters_not_positive(monkeypatch, capsys, argv):
+    monkeypatch.setattr("sys.argv", argv)
+    with pytest.raises(SystemExit) as exc:
+        s3_client.parse_parameters()
+    assert exc.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+
+
+def test_main_endpoint_options(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["s3_client", "--accelerate", "--dualstack"])
+    with patch.object(s3_client, "Config") as mock_config, patch.object(
+        s3_client, "S3"
+    ):
+        s3_client.main()
+    kwargs = mock_config.call_args.kwargs
+    assert kwargs["accelerate"] is True
+    assert kwargs["dualstack"] is True
+
+
+def test_parse_parameters_copy(monkeypatch):
+    argv = ["s3_client", "copy", "src", "dst", "-p", "logs/", "--dst-prefix", "old/"]
+    monkeypatch.setattr("sys.argv", argv)
+    args = s3_client.parse_parameters()
+    assert (args.src_bucket, args.dst_bucket) == ("src", "dst")
+    assert (args.prefix, args.filename, args.dst_prefix) == ("logs/", None, "old/")
+    assert args.func is s3_client.cmd_copy
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Test prefetch function."""
+
+import threading
+
+import pytest
+
+from s3_client import s3_client
+
+
+def test_prefetch():
+    assert list(s3_client.prefetch(iter(range(10)))) == list(range(10))
+
+
+def test_prefetch_empty():
+    assert list(s3_client.prefetch(iter([]))) == []
+
+
+def test_prefetch_reads_ahead():
+    """Test items are read ahead, before the current one is consumed."""
+    read = []
+    read_ahead = threading.Event()
+
+    def items():
+        for i in range(5):
+            read.append(i)
+            if i == 2:
+                read_ahead.set()
+            yield i
+
+    pages = s3_client.prefetch(items(), depth=2)
+    assert next(pages) == 0
+    assert read_ahead.wait(5)
+    assert read[:3] == [0, 1, 2]
+
+
+def test_prefetch_error():
+    """Test an error of the iterable is raised to the consumer, in order."""
+
+    def items():
+        yield 1
+        raise ValueError("listing failed")
+
+    pages = s3_client.prefetch(items())
+    assert next(pages) == 1
+    with pytest.raises(ValueError, match="listing failed"):
+        next(pages)
+
+
+def test_prefetch_stop_early():
+    """Test stopping early does not read the whole iterable."""
+    read = []
+
+    def items():
+        for i in range(1000):
+            read.append(i)
+            yield i
+
+    pages = s3_client.prefetch(items(), depth=2)
+    assert next(pages) == 0
+    pages.close()
+    assert len(read) <= 4
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Test run_parallel function."""
+
+from unittest.mock import Mock, call
+
+import pytest
+
+from s3_client import s3_client
+
+
+def test_run_parallel():
+    func = Mock()
+    count = s3_client.run_parallel(func, ((i, "x") for i in range(20)), 2)
+    assert count == 20
+    assert func.call_count == 20
+    func.assert_has_calls([call(i, "x") for i in range(20)], any_order=True)
+
+
+def test_run_parallel_empty():
+    func = Mock()
+    assert s3_client.run_parallel(func, iter([]), 2) == 0
+    func.assert_not_called()
+
+
+def test_run_parallel_stop_on_error():
+    func = Mock(side_effect=SystemExit(1))
+    consumed = []
+
+    def args():
+        for i in range(1000):
+            consumed.append(i)
+            yield (i,)
+
+    with pytest.raises(SystemExit):
+        s3_client.run_parallel(func, args(), 1)
+    assert len(consumed) < 1000
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test s3 class."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import moto
 from conftest import BUCKET_NAME, BUCKET_NAME_NOT_EXIST
@@ -22,5 +22,20 @@ def test_check_bucket_does_not_exist(s3, s3_bucket):
 @moto.mock_aws
 def test_check_bucket_already_checked(s3):
     s3_client.log = Mock()
-    s3.buckets_exist = ["my_bucket"]
+    s3.buckets_exist = {"my_bucket"}
     assert s3.check_bucket_exist("my_bucket") is True
+
+
+@moto.mock_aws
+def test_check_bucket_already_checked_not_exist(s3):
+    s3_client.log = Mock()
+    s3.buckets_not_exist = {"my_bucket"}
+    assert s3.check_bucket_exist("my_bucket") is False
+
+
+def test_check_bucket_does_not_exist_cached(s3, s3_bucket):
+    s3_client.log = Mock()
+    assert s3.check_bucket_exist(BUCKET_NAME_NOT_EXIST) is False
+    with patch.object(s3.client, "head_bucket") as mock_head:
+        assert s3.check_bucket_exist(BUCKET_NAME_NOT_EXIST) is False
+        mock_head.assert_not_called()
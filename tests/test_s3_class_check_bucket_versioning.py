@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""Test s3 class."""
+
+from conftest import BUCKET_NAME
+
+
+def test_check_bucket_versioning_never_enabled(s3, s3_bucket):
+    assert s3.check_bucket_versioning(BUCKET_NAME) is None
+
+
+def test_check_bucket_versioning_enabled(s3, s3_bucket):
+    s3_bucket.BucketVersioning(BUCKET_NAME).enable()
+    assert s3.check_bucket_versioning(BUCKET_NAME) == "Enabled"
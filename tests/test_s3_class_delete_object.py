@@ -4,7 +4,7 @@
 
 from unittest.mock import Mock, patch
 
-from conftest import BUCKET_NAME
+from conftest import BUCKET_NAME, KEY_NAMES
 
 from s3_client import s3_client
 
@@ -15,8 +15,8 @@ def test_delete_object(s3, s3_objects):
     """Test delete object."""
     s3_client.log = Mock()
     result = s3.delete_object(BUCKET_NAME, DELETE_KEY)
-    for obj in s3.s3_resource.Bucket(BUCKET_NAME).objects.all():
-        assert obj.key != DELETE_KEY
+    for obj in s3.list_objects(BUCKET_NAME):
+        assert obj["Key"] != DELETE_KEY
 
 
 def test_delete_object_no_version(s3, s3_objects):
@@ -25,10 +25,10 @@ def test_delete_object_no_version(s3, s3_objects):
 
     obj_to_delete = {"Key": DELETE_KEY}
 
-    with patch.object(s3, "s3_resource"):
+    with patch.object(s3, "client"):
         result = s3.delete_object(BUCKET_NAME, DELETE_KEY)
-        s3.s3_resource.Bucket(BUCKET_NAME).delete_objects.assert_called_with(
-            Delete={"Objects": [obj_to_delete]}
+        s3.client.delete_objects.assert_called_with(
+            Bucket=BUCKET_NAME, Delete={"Objects": [obj_to_delete]}
         )
 
 
@@ -39,8 +39,18 @@ def test_delete_object_version(s3, s3_objects):
     version_id = "1234567890"
     obj_to_delete = {"Key": DELETE_KEY, "VersionId": version_id}
 
-    with patch.object(s3, "s3_resource"):
+    with patch.object(s3, "client"):
         result = s3.delete_object(BUCKET_NAME, DELETE_KEY, version_id)
-        s3.s3_resource.Bucket(BUCKET_NAME).delete_objects.assert_called_with(
-            Delete={"Objects": [obj_to_delete]}
+        s3.client.delete_objects.assert_called_with(
+            Bucket=BUCKET_NAME, Delete={"Objects": [obj_to_delete]}
         )
+
+
+def test_delete_objects(s3, s3_objects):
+    """Test delete several objects with one request."""
+    s3_client.log = Mock()
+    delete_keys = ["A", "t01"]
+    result = s3.delete_objects(BUCKET_NAME, delete_keys)
+    assert not result.get("Errors")
+    keys = [obj["Key"] for obj in s3.list_objects(BUCKET_NAME)]
+    assert keys == [key for key in KEY_NAMES if key not in delete_keys]
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test s3 class."""
 
+import errno
 from unittest.mock import Mock, patch
 
 import pytest
@@ -28,12 +29,75 @@ def test_download_object_extraargs(s3, extraargs, versionid):
     s3_client.log = Mock()
     obj_name = "my_object"
     dest_name = "/tmp"
-    with patch.object(s3, "s3_resource"):
-        with patch.object(s3_client, "ProgressBar"):
+    with patch.object(s3, "client"), patch.object(s3, "transfer"):
+        with patch.object(s3_client, "ProgressBar"), patch.object(
+            s3_client, "check_disk_space"
+        ):
             s3_client.ProgressBar.return_value.__enter__.return_value.update_to = None
+            # Large object, downloaded by s3transfer
+            size = s3_client.SMALL_OBJECT_THRESHOLD + 1
+            s3.client.head_object.return_value = {"ContentLength": size}
 
             s3.download_object(BUCKET_NAME, obj_name, dest_name, versionid)
 
-            s3.s3_resource.Bucket(BUCKET_NAME).download_file.assert_called_with(
-                obj_name, dest_name, ExtraArgs=extraargs, Callback=None
+            s3.transfer.download_file.assert_called_with(
+                BUCKET_NAME, obj_name, dest_name, extra_args=extraargs, callback=None
             )
+
+
+def test_download_object_small_object(s3, s3_bucket, tmpdir):
+    """Test small objects are downloaded with a single GetObject request."""
+    s3_client.log = Mock()
+    obj_name = "my_object"
+    dest_name = "{}/{}".format(tmpdir, obj_name)
+    s3_bucket.Bucket(BUCKET_NAME).put_object(Key=obj_name, Body="content")
+    with patch.object(s3, "transfer") as mock_transfer:
+        with patch.object(
+            s3.client, "get_object", wraps=s3.client.get_object
+        ) as mock_get:
+            s3.download_object(BUCKET_NAME, obj_name, dest_name, obj_size=7)
+    mock_transfer.download_file.assert_not_called()
+    mock_get.assert_called_once_with(Bucket=BUCKET_NAME, Key=obj_name)
+    assert (tmpdir / obj_name).read() == "content"
+
+
+def test_download_object_small_object_version(s3, s3_bucket, tmpdir):
+    """Test small object download of a previous version."""
+    s3_client.log = Mock()
+    obj_name = "my_object"
+    dest_name = "{}/{}".format(tmpdir, obj_name)
+    bucket = s3_bucket.Bucket(BUCKET_NAME)
+    bucket.Versioning().enable()
+    versionid = bucket.put_object(Key=obj_name, Body="first").version_id
+    bucket.put_object(Key=obj_name, Body="second")
+    s3.download_object(BUCKET_NAME, obj_name, dest_name, versionid)
+    assert (tmpdir / obj_name).read() == "first"
+
+
+def test_download_object_known_size(s3, s3_bucket, tmpdir):
+    """Test object download does not look up a size already known."""
+    s3_client.log = Mock()
+    obj_name = "my_object"
+    obj_body = "Test object content"
+    dest_name = "{}/{}".format(tmpdir, obj_name)
+    s3_bucket.Bucket(BUCKET_NAME).put_object(Key=obj_name, Body=obj_body)
+    with patch.object(s3.client, "head_object") as mock_head:
+        s3.download_object(BUCKET_NAME, obj_name, dest_name, obj_size=len(obj_body))
+        mock_head.assert_not_called()
+    assert (tmpdir / obj_name).read() == obj_body
+
+
+def test_download_object_no_disk_space(s3, s3_bucket, tmpdir):
+    """Test object is not downloaded if it does not fit on disk."""
+    s3_client.log = Mock()
+    obj_name = "my_object"
+    dest_name = "{}/{}".format(tmpdir, obj_name)
+    s3_bucket.Bucket(BUCKET_NAME).put_object(Key=obj_name, Body="content")
+    with patch.object(s3_client.shutil, "disk_usage") as mock_usage:
+        mock_usage.return_value.free = 2
+        with patch.object(s3, "transfer") as mock_transfer:
+            with pytest.raises(OSError) as exc:
+                s3.download_object(BUCKET_NAME, obj_name, dest_name)
+            mock_transfer.download_file.assert_not_called()
+    assert exc.value.errno == errno.ENOSPC
+    mock_usage.assert_called_once_with(str(tmpdir))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Test s3 class."""
+
+import moto
+import pytest
+
+from s3_client import s3_client
+
+
+@moto.mock_aws
+def test_s3_client_config():
+    s3 = s3_client.S3(s3_client.Config(max_concurrency=4))
+    client_config = s3.client.meta.config
+    assert s3.max_concurrency == 4
+    assert client_config.max_pool_connections == s3_client.MIN_POOL_CONNECTIONS
+    assert client_config.tcp_keepalive is True
+    assert client_config.connect_timeout == s3_client.CONNECT_TIMEOUT
+    assert client_config.read_timeout == s3_client.READ_TIMEOUT
+    assert client_config.retries["mode"] == "adaptive"
+
+
+@moto.mock_aws
+def test_s3_client_config_large_pool():
+    config = s3_client.Config(max_concurrency=100, part_concurrency=20)
+    s3 = s3_client.S3(config)
+    assert s3.client.meta.config.max_pool_connections == 120
+
+
+@moto.mock_aws
+def test_s3_transfer_config():
+    s3 = s3_client.S3(s3_client.Config())
+    assert s3.transfer_config.multipart_threshold == s3_client.MULTIPART_SIZE
+    assert s3.transfer_config.multipart_chunksize == s3_client.MULTIPART_SIZE
+    assert s3.transfer_config.max_concurrency >= 10
+    assert s3.transfer_config.io_chunksize == 1024 * 1024
+    assert s3.transfer_config.max_concurrency >= s3_client.DEFAULT_MAX_CONCURRENCY
+
+
+@moto.mock_aws
+def test_s3_transfer_config_part_options():
+    config = s3_client.Config(part_size=8 * s3_client.MIB, part_concurrency=3)
+    s3 = s3_client.S3(config)
+    assert s3.transfer_config.multipart_threshold == 8 * s3_client.MIB
+    assert s3.transfer_config.multipart_chunksize == 8 * s3_client.MIB
+    assert s3.transfer_config.max_concurrency == 3
+
+
+@moto.mock_aws
+@pytest.mark.parametrize("accelerate, dualstack", [(False, False), (True, True)])
+def test_s3_client_config_endpoints(accelerate, dualstack):
+    config = s3_client.Config(accelerate=accelerate, dualstack=dualstack)
+    s3 = s3_client.S3(config)
+    s3_config = s3.client.meta.config.s3
+    assert s3_config["use_accelerate_endpoint"] is accelerate
+    assert s3_config["use_dualstack_endpoint"] is dualstack
@@ -12,12 +12,18 @@ from s3_client import s3_client
 def test_list_buckets(s3, s3_bucket):
     s3_client.log = Mock()
     result = s3.list_buckets()
-    assert BUCKET_NAME == [x.name for x in result][0]
-    assert 1 == len([x.name for x in result])
+    assert BUCKET_NAME == [x["Name"] for x in result][0]
+    assert 1 == len([x["Name"] for x in result])
 
 
 @moto.mock_aws()
 def test_list_buckets_empty(s3):
     s3_client.log = Mock()
     result = s3.list_buckets()
-    assert 0 == len([x.name for x in result])
+    assert 0 == len([x["Name"] for x in result])
+
+
+def test_bucket_acl(s3, s3_bucket):
+    s3_client.log = Mock()
+    grants = s3.bucket_acl(BUCKET_NAME)
+    assert grants[0]["Permission"] == "FULL_CONTROL"
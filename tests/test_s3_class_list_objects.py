@@ -1,32 +1,31 @@
 # -*- coding: utf-8 -*-
 """Test s3 class."""
 
-from unittest.mock import Mock
-
 import pytest
 from conftest import BUCKET_NAME, KEY_NAMES
 
-from s3_client import s3_client
-
 
-@pytest.mark.parametrize("prefix", [("t"), ("test")])
+@pytest.mark.parametrize("prefix", [None, "t", "test", "x"])
 def test_list_objects_prefix(s3, s3_objects, prefix):
-    s3_client.log = Mock()
-    num_keys = [i for i in KEY_NAMES if i.startswith(prefix)]
-    result = s3.list_objects(BUCKET_NAME, prefix=prefix)
-    assert len(num_keys) == len([x.key for x in result])
-
-
-def test_list_objects(s3, s3_objects):
-    s3_client.log = Mock()
-    result = s3.list_objects(BUCKET_NAME)
-    assert len(KEY_NAMES) == len([x.key for x in result])
-    assert KEY_NAMES[0] == [x.key for x in result][0]
+    expected = [key for key in KEY_NAMES if key.startswith(prefix or "")]
+    result = list(s3.list_objects(BUCKET_NAME, prefix=prefix))
+    assert [obj["Key"] for obj in result] == expected
+    assert all(obj["Size"] == len("body") for obj in result)
 
 
-@pytest.mark.parametrize("limit", [(1), (2), (3), (4)])
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
 def test_list_objects_limit(s3, s3_objects, limit):
-    s3_client.log = Mock()
-    result = s3.list_objects(BUCKET_NAME, limit=limit)
-    assert limit == len([x.key for x in result])
-    assert KEY_NAMES[0] == [x.key for x in result][0]
+    result = list(s3.list_objects(BUCKET_NAME, limit=limit))
+    assert [obj["Key"] for obj in result] == KEY_NAMES[:limit]
+
+
+def test_list_objects_limit_page_size(s3, s3_objects):
+    requests = []
+    s3.client.meta.events.register(
+        "before-parameter-build.s3.ListObjectsV2",
+        lambda params, **kwargs: requests.append(params),
+    )
+    result = list(s3.list_objects(BUCKET_NAME, limit=2))
+    assert len(result) == 2
+    assert len(requests) == 1
+    assert requests[0]["MaxKeys"] == 2
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Test s3 class."""
+
+import pytest
+from conftest import BUCKET_NAME, KEY_NAMES
+
+
+@pytest.fixture(scope="function")
+def versioned_objects(s3_bucket):
+    s3_bucket.BucketVersioning(BUCKET_NAME).enable()
+    for key in KEY_NAMES:
+        s3_bucket.Object(BUCKET_NAME, key).put(Body="body")
+    s3_bucket.Object(BUCKET_NAME, KEY_NAMES[0]).put(Body="body2")
+    s3_bucket.Object(BUCKET_NAME, KEY_NAMES[1]).delete()
+    return s3_bucket
+
+
+def test_list_objects_versions(s3, versioned_objects):
+    result = list(s3.list_objects_versions(BUCKET_NAME))
+    # Two versions of the first key and a delete marker of the second
+    assert len(result) == len(KEY_NAMES) + 2
+    markers = [obj for obj in result if "Size" not in obj]
+    assert [obj["Key"] for obj in markers] == [KEY_NAMES[1]]
+    assert sum(obj["Key"] == KEY_NAMES[0] for obj in result) == 2
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+def test_list_objects_versions_limit(s3, versioned_objects, limit):
+    assert len(list(s3.list_objects_versions(BUCKET_NAME, limit=limit))) == limit
+
+
+def test_list_objects_versions_prefix(s3, versioned_objects):
+    result = list(s3.list_objects_versions(BUCKET_NAME, prefix="test"))
+    expected = [key for key in KEY_NAMES if key.startswith("test")]
+    assert sorted({obj["Key"] for obj in result}) == sorted(expected)
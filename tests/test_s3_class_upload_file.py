@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Test s3 class."""
 
-from unittest.mock import Mock
+import base64
+import hashlib
+from unittest.mock import ANY, Mock, patch
 
 from conftest import BUCKET_NAME, TMP_FILENAME
 
@@ -23,3 +25,43 @@ def test_upload_file_with_keyname(tmp_filename, s3, s3_bucket):
     s3.upload_file(BUCKET_NAME, tmp_filename, key_name)
     body = s3_bucket.Object(BUCKET_NAME, key_name).get()["Body"].read().decode("utf-8")
     assert body == TMP_FILENAME
+
+
+def test_upload_file_transfer_manager(tmp_filename, s3):
+    s3_client.log = Mock()
+    s3.small_object_threshold = 0
+    with patch.object(s3, "transfer") as mock_transfer:
+        s3.upload_file(BUCKET_NAME, tmp_filename)
+    mock_transfer.upload_file.assert_called_once_with(
+        tmp_filename, BUCKET_NAME, tmp_filename, callback=ANY
+    )
+
+
+def test_upload_file_small_file(tmp_filename, s3, s3_bucket):
+    s3_client.log = Mock()
+    with patch.object(s3, "transfer") as mock_transfer:
+        s3.upload_file(BUCKET_NAME, tmp_filename, "small")
+    mock_transfer.upload_file.assert_not_called()
+    body = s3_bucket.Object(BUCKET_NAME, "small").get()["Body"].read()
+    assert body == TMP_FILENAME.encode()
+
+
+def test_upload_file_small_file_md5(tmp_filename, s3, s3_bucket):
+    s3_client.log = Mock()
+    client = s3.client
+    with patch.object(client, "put_object", wraps=client.put_object) as mock_put:
+        s3.upload_file(BUCKET_NAME, tmp_filename, "small")
+    md5 = base64.b64encode(hashlib.md5(TMP_FILENAME.encode()).digest()).decode()
+    assert mock_put.call_args.kwargs["ContentMD5"] == md5
+
+
+def test_upload_file_known_size(tmp_filename, s3):
+    s3_client.log = Mock()
+    with patch.object(s3, "transfer") as mock_transfer, patch.object(
+        s3_client.os.path, "getsize"
+    ) as mock_getsize:
+        s3.upload_file(
+            BUCKET_NAME, tmp_filename, obj_size=s3.small_object_threshold + 1
+        )
+    mock_getsize.assert_not_called()
+    mock_transfer.upload_file.assert_called_once()
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Test to_json function."""
+
+import datetime
+import json
+
+from s3_client import s3_client
+
+
+def test_to_json():
+    date = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    data = {"Key": "file.txt", "LastModified": date, "Size": 10}
+    output = s3_client.to_json(data)
+    assert json.loads(output) == {
+        "Key": "file.txt",
+        "LastModified": "2020-01-02 03:04:05+00:00",
+        "Size": 10,
+    }
+    assert output.startswith('{\n  "Key"')
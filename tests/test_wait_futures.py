@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Test wait_futures function."""
+
+import concurrent.futures
+from unittest.mock import Mock
+
+import pytest
+
+from s3_client import s3_client
+
+
+def test_wait_futures():
+    func = Mock()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(func, i) for i in range(5)]
+        s3_client.wait_futures(executor, futures)
+    assert func.call_count == 5
+
+
+def test_wait_futures_reraise_exit():
+    func = Mock(side_effect=SystemExit(1))
+    with pytest.raises(SystemExit):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            futures = [executor.submit(func)]
+            s3_client.wait_futures(executor, futures)